@@ -14,6 +14,7 @@ from agents.polymarket.gamma import GammaMarketClient as Gamma
 from agents.connectors.chroma import PolymarketRAG as Chroma
 from agents.utils.objects import SimpleEvent, SimpleMarket
 from agents.application.prompts import Prompter
+from agents.application.llm_cache import LLMCache, request_key
 from agents.polymarket.polymarket import Polymarket
 
 def retain_keys(data, keys_to_retain):
@@ -39,16 +40,27 @@ class Executor:
             model=default_model, #gpt-3.5-turbo"
             temperature=0,
         )
+        self.llm_cache = LLMCache()
         self.gamma = Gamma()
         self.chroma = Chroma()
         self.polymarket = Polymarket()
 
+    def _invoke_cached(self, messages) -> str:
+        # Only deterministic (temperature 0) calls are safe to answer from cache
+        if self.llm.temperature != 0:
+            return self.llm.invoke(messages).content
+        key = request_key(self.llm.model_name, messages)
+        response = self.llm_cache.get(key)
+        if response is None:
+            response = self.llm.invoke(messages).content
+            self.llm_cache.set(key, response)
+        return response
+
     def get_llm_response(self, user_input: str) -> str:
         system_message = SystemMessage(content=str(self.prompter.market_analyst()))
         human_message = HumanMessage(content=user_input)
         messages = [system_message, human_message]
-        result = self.llm.invoke(messages)
-        return result.content
+        return self._invoke_cached(messages)
 
     def get_superforecast(
         self, event_title: str, market_question: str, outcome: str
@@ -56,8 +68,7 @@ class Executor:
         messages = self.prompter.superforecaster(
             description=event_title, question=market_question, outcome=outcome
         )
-        result = self.llm.invoke(messages)
-        return result.content
+        return self._invoke_cached(messages)
 
 
     def estimate_tokens(self, text: str) -> int:
@@ -70,8 +81,7 @@ class Executor:
         )
         human_message = HumanMessage(content=user_input)
         messages = [system_message, human_message]
-        result = self.llm.invoke(messages)
-        return result.content
+        return self._invoke_cached(messages)
 
 
     def divide_list(self, original_list, i):
@@ -0,0 +1,112 @@
+"""
+Disk-backed cache of LLM responses keyed on the exact request, so repeating
+a deterministic prompt returns the stored answer instead of calling the model.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from agents.utils import fast_json
+from agents.utils.files import atomic_write_bytes
+
+
+def request_key(model: str, messages: Any, tools: Sequence[str] = ()) -> str:
+    """
+    Hash an LLM request into a stable cache key.
+
+    Args:
+        model: Model name the request is sent to
+        messages: A prompt string or a list of LangChain messages
+        tools: Names of the tools bound to the request
+
+    Returns:
+        Hex SHA-256 digest of the canonicalised request
+    """
+    if isinstance(messages, str):
+        messages = [("human", messages)]
+    else:
+        messages = [(message.type, message.content) for message in messages]
+    payload = {"model": model, "messages": messages, "tools": sorted(tools)}
+    return hashlib.sha256(fast_json.dumps(payload)).hexdigest()
+
+
+class LLMCache:
+    """LRU cache of LLM responses with a TTL, persisted as one JSON file"""
+
+    def __init__(
+        self,
+        path: str = "data/llm_cache.json",
+        ttl: float = 60 * 60,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize the cache, loading any unexpired entries from disk.
+
+        Args:
+            path: File the cache is persisted to
+            ttl: Seconds a response stays valid
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # Responses keyed by request hash, as (stored_at, response), oldest use first
+        self._entries = OrderedDict()
+        self._load()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Request hash from request_key()
+
+        Returns:
+            The cached response, or None on a miss or an expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response and persist the cache.
+
+        Args:
+            key: Request hash from request_key()
+            response: Model output to cache
+        """
+        self._entries[key] = (time.time(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._save()
+
+    def _load(self) -> None:
+        """Read unexpired entries from disk, ignoring a missing or unreadable file"""
+        try:
+            entries = fast_json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return
+        cutoff = time.time() - self.ttl
+        # Entries are saved least recently used first, so file order is LRU order
+        for key, stored_at, response in entries:
+            if stored_at > cutoff:
+                self._entries[key] = (stored_at, response)
+
+    def _save(self) -> None:
+        """Write the cache to disk, swapping the file in atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = fast_json.dumps(
+            [(key, stored_at, response) for key, (stored_at, response) in self._entries.items()]
+        )
+        atomic_write_bytes(self.path, data)
@@ -1,13 +1,31 @@
 import os
-import json
-import datetime
+import sys
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import gzip
+import logging
+import threading
+import time
 import httpx
-from typing import List, Dict, Any, Optional
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from agents.utils import fast_json
+from agents.utils.addresses import address_key
+from agents.utils.files import atomic_write_bytes
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# Slotted dataclasses need Python 3.10+, so older interpreters fall back to __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TraderInfo:
     """Information about a trader on Polymarket"""
     address: str
@@ -19,6 +37,219 @@ class TraderInfo:
     total_wins: Optional[float] = None
     total_losses: Optional[float] = None
     current_value: Optional[float] = None
+    
+    @classmethod
+    def from_dict(
+        cls,
+        item: Dict[str, Any],
+        fields: Optional[Tuple[Tuple[str, str, Any], ...]] = None,
+        **overrides: Any
+    ) -> "TraderInfo":
+        """
+        Build a TraderInfo from a raw API record
+        
+        Args:
+            item: Record returned by an analytics API
+            fields: Decoding table of a given source, built with _field_specs
+            overrides: Field values to use instead of reading them from the record
+            
+        Returns:
+            TraderInfo with numeric fields coerced to their declared types
+        """
+        get = item.get
+        return cls(**{
+            name: (
+                overrides[name] if name in overrides
+                else get(key) if convert is None
+                else convert(get(key, 0))
+            )
+            for name, key, convert in fields or _POLYMARKETANALYTICS_FIELDS
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the trader to a plain dict, e.g. for caching as JSON"""
+        return {name: getattr(self, name) for name, _ in _TRADER_FIELDS}
+
+
+# TraderInfo fields paired with the converter applied to their raw values
+_TRADER_FIELDS = (
+    ("address", None),
+    ("username", None),
+    ("pnl", float),
+    ("win_rate", float),
+    ("total_positions", int),
+    ("active_positions", int),
+    ("total_wins", float),
+    ("total_losses", float),
+    ("current_value", float),
+)
+
+def _field_specs(aliases: Dict[str, str]) -> Tuple[Tuple[str, str, Any], ...]:
+    """
+    Resolve a source's record keys once, so decoding rows doesn't repeat the lookups
+    
+    Args:
+        aliases: Record keys of the source where they differ from the TraderInfo field names
+        
+    Returns:
+        Tuple of (field name, record key, converter) for every TraderInfo field
+    """
+    return tuple((name, aliases.get(name, name), convert) for name, convert in _TRADER_FIELDS)
+
+
+# Decoding tables for the records of each source
+_POLYMARKETANALYTICS_FIELDS = _field_specs({})
+
+_POLYMARKETWHALES_FIELDS = _field_specs({
+    "username": "name",
+    "total_wins": "wins_value",
+    "total_losses": "losses_value",
+    "current_value": "holdings_value",
+})
+
+_SUBGRAPH_FIELDS = _field_specs({
+    "pnl": "totalPnl",
+    "total_positions": "totalPositions",
+    "active_positions": "activePositions",
+    "total_wins": "totalWins",
+    "total_losses": "totalLosses",
+    "current_value": "currentValue",
+})
+
+
+# GraphQL query to get top traders by PnL
+_TOP_TRADERS_QUERY = """
+query TopTraders($count: Int) {
+  users(
+    first: $count
+    orderBy: totalPnl
+    orderDirection: desc
+    where: { totalPnl_gt: 10000 }
+  ) {
+    id
+    address
+    totalPnl
+    winCount
+    loseCount
+    totalPositions
+    activePositions
+    totalWins
+    totalLosses
+    currentValue
+  }
+}
+"""
+
+# GraphQL query to get the metrics of a batch of traders by address
+_TRADER_INFO_QUERY = """
+query TraderInfo($addresses: [String!]) {
+  users(first: 1000, where: { id_in: $addresses }) {
+    id
+    address
+    totalPnl
+    winCount
+    loseCount
+    totalPositions
+    activePositions
+    totalWins
+    totalLosses
+    currentValue
+  }
+}
+"""
+
+# Headers for request bodies that are already JSON encoded
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Largest response body accepted from an analytics API - 4 MiB
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+# Columns used to rank recommended traders
+_RANKING_DTYPE = np.dtype([("pnl", "f8"), ("win_rate", "f8")])
+
+
+async def _read_body(response: httpx.Response, limit: int = MAX_RESPONSE_BYTES) -> bytearray:
+    """
+    Read a streamed response body, refusing to buffer more than limit bytes
+    
+    Args:
+        response: Response opened with client.stream()
+        limit: Maximum decoded body size in bytes
+        
+    Returns:
+        The response body
+    """
+    if int(response.headers.get("Content-Length", 0)) > limit:
+        raise ValueError(f"Response from {response.url} exceeds {limit} bytes")
+    
+    body = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+        body.extend(chunk)
+        if len(body) > limit:
+            raise ValueError(f"Response from {response.url} exceeds {limit} bytes")
+    return body
+
+
+def _filter_sort(
+    pnl: np.ndarray,
+    win_rate: np.ndarray,
+    min_win_rate: float,
+    min_pnl: float
+) -> np.ndarray:
+    """
+    Rank traders given as parallel column arrays
+    
+    Args:
+        pnl: Profit and loss per trader, zero when unknown
+        win_rate: Win rate per trader, zero when unknown
+        min_win_rate: Minimum win rate to keep a trader
+        min_pnl: Minimum profit and loss to keep a trader
+        
+    Returns:
+        Indices into the input arrays of the qualifying traders, by PnL descending
+    """
+    # Filter by criteria (zero stands in for missing values, which never qualify)
+    mask = (win_rate != 0) & (win_rate >= min_win_rate) & (pnl != 0) & (pnl >= min_pnl)
+    
+    # Sort by PnL descending, keeping ties in their original order
+    candidates = np.flatnonzero(mask)
+    order = np.argsort(-pnl[candidates], kind="stable")
+    return candidates[order]
+
+
+def _subgraph_win_rates(users: List[Dict[str, Any]]) -> List[float]:
+    """Calculate each subgraph user's win rate from their win and loss counts"""
+    win_counts = np.fromiter((int(u.get("winCount", 0)) for u in users), np.int64, count=len(users))
+    lose_counts = np.fromiter((int(u.get("loseCount", 0)) for u in users), np.int64, count=len(users))
+    total_counts = win_counts + lose_counts
+    win_rates = np.divide(
+        win_counts,
+        total_counts,
+        out=np.zeros(len(users), dtype=np.float64),
+        where=total_counts > 0
+    )
+    return win_rates.tolist()
+
+
+@functools.lru_cache(maxsize=32)
+def _placeholder_traders(source: str, count: int) -> Tuple[TraderInfo, ...]:
+    """Build the placeholder traders for a source"""
+    prefix = 100 if source == "polymarketanalytics" else 200 if source == "polymarketwhales" else 300
+    
+    return tuple(
+        TraderInfo(
+            address=f"0x{i+prefix:040x}",
+            username=f"{source}_trader{i}" if source != "subgraph" else None,
+            pnl=100000 / i,
+            win_rate=0.8 - (i * 0.02),
+            total_positions=100 + i,
+            active_positions=10 + i,
+            total_wins=120000 / i,
+            total_losses=20000 / i,
+            current_value=50000 / i
+        )
+        for i in range(1, count + 1)
+    )
 
 
 class PolymarketAnalytics:
@@ -33,6 +264,33 @@ class PolymarketAnalytics:
         # Default cache expiry - 24 hours
         self.cache_expiry = 24 * 60 * 60
         
+        # How long to wait before retrying a source that failed - 5 minutes
+        self.error_cache_expiry = 5 * 60
+        
+        # How long a trader's performance lookup is reused - 10 minutes
+        self.performance_cache_expiry = 10 * 60
+        
+        # Decoded cache files, keyed by path, as (mtime_ns, fetched_at, traders)
+        self._mem_cache = {}
+        
+        # Trader performance lookups, keyed by address, as (fetched_at, trader)
+        self._performance_cache = {}
+        
+        # Background event loop that runs the sync entry points, and the
+        # long-lived HTTP client it owns, both started on first use
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        self._client = None
+        
+        # Top-trader fetches in progress, keyed by (source, count)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Sources with a background cache refresh in progress
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        
         # API endpoints for analytics services
         self.api_endpoints = {
             "polymarketanalytics": "https://api.polymarketanalytics.com/v1/traders",
@@ -46,6 +304,73 @@ class PolymarketAnalytics:
             "polymarketwhales": os.getenv("POLYMARKET_WHALES_API_KEY", "")
         }
     
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP client"""
+        return httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop if it isn't running yet"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # A daemon thread, so an instance that is never closed doesn't block exit
+                thread = threading.Thread(target=loop.run_forever, name="analytics-loop", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+    
+    def _run(self, coro):
+        """
+        Run a coroutine on the background event loop and wait for its result.
+        
+        Every sync call goes through the same loop, so they all reuse one
+        HTTP client and its open connections instead of reconnecting.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+    
+    @contextlib.asynccontextmanager
+    async def _client_session(self):
+        """
+        Provide an HTTP client for one batch of requests: the long-lived client
+        on the background loop, or a temporary one in any other event loop,
+        since clients can't be shared between loops
+        """
+        if asyncio.get_running_loop() is self._loop:
+            if self._client is None:
+                self._client = self._async_client()
+            yield self._client
+        else:
+            async with self._async_client() as client:
+                yield client
+    
+    async def _aclose_client(self) -> None:
+        """Close the long-lived client, from the background loop"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def close(self) -> None:
+        """Close the long-lived HTTP client and stop the background event loop"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._aclose_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    def __enter__(self) -> "PolymarketAnalytics":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def get_top_traders(self, source: str = "polymarketanalytics", count: int = 10) -> List[TraderInfo]:
         """
         Get list of top traders from a specified analytics source.
@@ -57,58 +382,262 @@ class PolymarketAnalytics:
         Returns:
             List of TraderInfo objects containing trader data
         """
-        # First check if we have this data cached and not expired
-        cache_file = self.cache_dir / f"{source}_top_traders.json"
+        return self._run(self.aget_top_traders(source=source, count=count))
+    
+    async def aget_top_traders(
+        self,
+        source: str = "polymarketanalytics",
+        count: int = 10,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[TraderInfo]:
+        """
+        Async version of get_top_traders.
+        
+        Args:
+            source: Source to fetch data from ("polymarketanalytics", "polymarketwhales", "subgraph")
+            count: Number of traders to return
+            client: Shared async HTTP client; one from _client_session() is used if omitted
+            
+        Returns:
+            List of TraderInfo objects containing trader data
+        """
+        # Reject unknown sources before touching the cache
+        self._get_fetcher(source)
+        cache_file = self.cache_dir / f"{source}_top_traders.json.gz"
         
-        if cache_file.exists():
-            file_age = datetime.datetime.now().timestamp() - cache_file.stat().st_mtime
+        # First check if we have this data cached
+        cached = self._load_cached_traders(cache_file)
+        if cached is not None:
+            fetched_at, traders = cached
+            
+            # Serve expired data immediately and refresh it in the background
+            if time.time() - fetched_at >= self.cache_expiry:
+                self._refresh_in_background(source, count)
             
-            # Use cached data if not expired
-            if file_age < self.cache_expiry:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    # Convert cached data to TraderInfo objects
-                    return [TraderInfo(**trader) for trader in cached_data[:count]]
+            return list(traders[:count])
+        
+        # Otherwise fetch fresh data, unless this source failed very recently
+        traders = []
+        if not self._recently_failed(source):
+            traders = await self._fetch_shared(source, count, client)
+        
+        if traders:
+            self._save_cached_traders(source, traders)
+        else:
+            # If we couldn't get real data and have no cache, return placeholder data
+            self._mark_failed(source)
+            logger.warning("Using placeholder data for %s", source)
+            traders = self._get_placeholder_traders(source, count)
+        
+        return traders[:count]
+    
+    def _get_fetcher(self, source: str):
+        """
+        Look up the coroutine function that fetches top traders from a source
         
-        # Otherwise fetch fresh data
+        Args:
+            source: Source to fetch data from ("polymarketanalytics", "polymarketwhales", "subgraph")
+            
+        Returns:
+            Async fetch method taking a client and a count
+        """
         if source == "polymarketanalytics":
-            traders = self._fetch_from_polymarketanalytics(count)
+            return self._afetch_from_polymarketanalytics
         elif source == "polymarketwhales":
-            traders = self._fetch_from_polymarketwhales(count)
+            return self._afetch_from_polymarketwhales
         elif source == "subgraph":
-            traders = self._fetch_from_subgraph(count)
+            return self._afetch_from_subgraph
         else:
             raise ValueError(f"Unknown source: {source}")
+    
+    async def _fetch_shared(
+        self,
+        source: str,
+        count: int,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[TraderInfo]:
+        """
+        Fetch top traders from a source, sharing a single in-flight request
+        between all concurrent callers asking for the same source and count,
+        whether they run in this event loop or in another thread.
         
-        # If we couldn't get real data and have no cache, return placeholder data
-        if not traders and not cache_file.exists():
-            print(f"Warning: Using placeholder data for {source}")
-            traders = self._get_placeholder_traders(source, count)
+        Args:
+            source: Source to fetch data from
+            count: Number of traders to fetch
+            client: Shared async HTTP client; one from _client_session() is used if omitted
+            
+        Returns:
+            List of TraderInfo objects
+        """
+        key = (source, count)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
         
-        # Cache the result
-        if traders:
-            with open(cache_file, 'w') as f:
-                json.dump([vars(trader) for trader in traders], f)
+        # Another caller is already fetching this, so wait for its result
+        if not is_leader:
+            return list(await asyncio.wrap_future(future))
         
-        return traders[:count]
+        try:
+            fetch = self._get_fetcher(source)
+            if client is None:
+                async with self._client_session() as client:
+                    traders = await fetch(client, count)
+            else:
+                traders = await fetch(client, count)
+            future.set_result(traders)
+            return traders
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _load_cached_traders(self, cache_file: Path) -> Optional[Tuple[float, Tuple[TraderInfo, ...]]]:
+        """
+        Load cached traders regardless of their age
+        
+        Args:
+            cache_file: Path of the cache file
+            
+        Returns:
+            Tuple of the fetch timestamp and cached traders, or None if there is no usable cache
+        """
+        try:
+            mtime = cache_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        # Reuse the already decoded traders while the file hasn't been rewritten
+        in_memory = self._mem_cache.get(cache_file)
+        if in_memory is not None and in_memory[0] == mtime:
+            return in_memory[1], in_memory[2]
+        
+        try:
+            cached_data = fast_json.loads(gzip.decompress(cache_file.read_bytes()))
+            # Convert cached data to TraderInfo objects
+            traders = tuple(TraderInfo(**trader) for trader in cached_data["traders"])
+            fetched_at = cached_data["fetched_at"]
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError, KeyError) as e:
+            logger.warning("Ignoring unreadable cache file %s: %s", cache_file, e)
+            return None
+        
+        self._mem_cache[cache_file] = (mtime, fetched_at, traders)
+        return fetched_at, traders
+    
+    def _save_cached_traders(self, source: str, traders: List[TraderInfo]) -> None:
+        """
+        Cache traders fetched from a source, stamped with the fetch time
+        
+        Args:
+            source: Source the traders were fetched from
+            traders: Traders to cache
+        """
+        cache_file = self.cache_dir / f"{source}_top_traders.json.gz"
+        fetched_at = time.time()
+        data = fast_json.dumps({
+            "fetched_at": fetched_at,
+            "traders": [trader.to_dict() for trader in traders]
+        })
+        
+        # Swap the new cache in whole, so readers never see a partial one
+        atomic_write_bytes(cache_file, gzip.compress(data, compresslevel=1))
+        
+        self._mem_cache[cache_file] = (cache_file.stat().st_mtime_ns, fetched_at, tuple(traders))
+    
+    def _recently_failed(self, source: str) -> bool:
+        """
+        Check whether fetching from a source failed within the error cache window
+        
+        Args:
+            source: Source to check
+            
+        Returns:
+            True if the source should not be queried again yet
+        """
+        error_file = self.cache_dir / f"{source}_top_traders.err"
+        try:
+            failed_at = error_file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - failed_at < self.error_cache_expiry
+    
+    def _mark_failed(self, source: str) -> None:
+        """
+        Record a failed fetch so the source isn't retried until the error cache expires
+        
+        Args:
+            source: Source that failed
+        """
+        # Don't push the expiry back while we're still inside the window
+        if not self._recently_failed(source):
+            error_file = self.cache_dir / f"{source}_top_traders.err"
+            error_file.touch()
     
-    def _fetch_from_polymarketanalytics(self, count: int) -> List[TraderInfo]:
+    def _refresh_in_background(self, source: str, count: int) -> None:
+        """
+        Start refreshing a source's cache in a separate thread
+        
+        Args:
+            source: Source to refresh
+            count: Number of traders to fetch
+        """
+        with self._refresh_lock:
+            if source in self._refreshing or self._recently_failed(source):
+                return
+            self._refreshing.add(source)
+        
+        # Not a daemon thread, so short-lived CLI runs still finish the refresh on exit
+        thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._refresh_top_traders(source, count),),
+            name=f"refresh-{source}"
+        )
+        thread.start()
+    
+    async def _refresh_top_traders(self, source: str, count: int) -> None:
+        """
+        Fetch fresh data for a source and update its cache
+        
+        Args:
+            source: Source to refresh
+            count: Number of traders to fetch
+        """
+        try:
+            traders = await self._fetch_shared(source, count)
+            
+            if traders:
+                self._save_cached_traders(source, traders)
+            else:
+                self._mark_failed(source)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(source)
+    
+    async def _afetch_from_polymarketanalytics(self, client: httpx.AsyncClient, count: int) -> List[TraderInfo]:
         """
         Fetch top traders from polymarketanalytics.com
         
         Args:
+            client: Async HTTP client to issue the request with
             count: Number of traders to fetch
             
         Returns:
             List of TraderInfo objects
         """
-        print("Fetching data from PolymarketAnalytics.com...")
+        logger.info("Fetching data from PolymarketAnalytics.com...")
         
         endpoint = self.api_endpoints.get("polymarketanalytics")
         api_key = self.api_keys.get("polymarketanalytics")
         
         if not endpoint:
-            print("Error: No endpoint configured for PolymarketAnalytics")
+            logger.error("No endpoint configured for PolymarketAnalytics")
             return []
         
         # Prepare request parameters
@@ -126,58 +655,48 @@ class PolymarketAnalytics:
         
         try:
             # Make the API request
-            response = httpx.get(endpoint, params=params, headers=headers, timeout=30.0)
+            async with client.stream("GET", endpoint, params=params, headers=headers) as response:
+                body = await _read_body(response)
             
             if response.status_code != 200:
-                print(f"API request failed with status code: {response.status_code}")
-                print(f"Response: {response.text}")
+                logger.warning(
+                    "API request failed with status code: %s\nResponse: %s",
+                    response.status_code,
+                    body.decode(errors="replace")
+                )
                 return []
             
             # Parse the response
-            data = response.json()
+            data = fast_json.loads(body)
             if not data.get("traders", []):
-                print("No traders found in the API response")
+                logger.warning("No traders found in the API response")
                 return []
             
             # Convert the API response to TraderInfo objects
-            traders = []
-            for item in data.get("traders", []):
-                trader = TraderInfo(
-                    address=item.get("address"),
-                    username=item.get("username"),
-                    pnl=float(item.get("pnl", 0)),
-                    win_rate=float(item.get("win_rate", 0)),
-                    total_positions=int(item.get("total_positions", 0)),
-                    active_positions=int(item.get("active_positions", 0)),
-                    total_wins=float(item.get("total_wins", 0)),
-                    total_losses=float(item.get("total_losses", 0)),
-                    current_value=float(item.get("current_value", 0))
-                )
-                traders.append(trader)
-            
-            return traders
+            return [TraderInfo.from_dict(item) for item in data["traders"]]
             
         except Exception as e:
-            print(f"Error fetching data from PolymarketAnalytics: {e}")
+            logger.error("Error fetching data from PolymarketAnalytics: %s", e)
             return []
     
-    def _fetch_from_polymarketwhales(self, count: int) -> List[TraderInfo]:
+    async def _afetch_from_polymarketwhales(self, client: httpx.AsyncClient, count: int) -> List[TraderInfo]:
         """
         Fetch top traders from polymarketwhales.info
         
         Args:
+            client: Async HTTP client to issue the request with
             count: Number of traders to fetch
             
         Returns:
             List of TraderInfo objects
         """
-        print("Fetching data from PolymarketWhales.info...")
+        logger.info("Fetching data from PolymarketWhales.info...")
         
         endpoint = self.api_endpoints.get("polymarketwhales")
         api_key = self.api_keys.get("polymarketwhales")
         
         if not endpoint:
-            print("Error: No endpoint configured for PolymarketWhales")
+            logger.error("No endpoint configured for PolymarketWhales")
             return []
         
         # Prepare request parameters
@@ -194,133 +713,92 @@ class PolymarketAnalytics:
         
         try:
             # Make the API request
-            response = httpx.get(endpoint, params=params, headers=headers, timeout=30.0)
+            async with client.stream("GET", endpoint, params=params, headers=headers) as response:
+                body = await _read_body(response)
             
             if response.status_code != 200:
-                print(f"API request failed with status code: {response.status_code}")
-                print(f"Response: {response.text}")
+                logger.warning(
+                    "API request failed with status code: %s\nResponse: %s",
+                    response.status_code,
+                    body.decode(errors="replace")
+                )
                 return []
             
             # Parse the response
-            data = response.json()
+            data = fast_json.loads(body)
             if not data.get("traders", []):
-                print("No traders found in the API response")
+                logger.warning("No traders found in the API response")
                 return []
             
             # Convert the API response to TraderInfo objects
-            traders = []
-            for item in data.get("traders", []):
-                trader = TraderInfo(
-                    address=item.get("address"),
-                    username=item.get("name"),
-                    pnl=float(item.get("pnl", 0)),
-                    win_rate=float(item.get("win_rate", 0)),
-                    total_positions=int(item.get("total_positions", 0)),
-                    active_positions=int(item.get("active_positions", 0)),
-                    total_wins=float(item.get("wins_value", 0)),
-                    total_losses=float(item.get("losses_value", 0)),
-                    current_value=float(item.get("holdings_value", 0))
-                )
-                traders.append(trader)
-            
-            return traders
+            return [
+                TraderInfo.from_dict(item, _POLYMARKETWHALES_FIELDS)
+                for item in data["traders"]
+            ]
             
         except Exception as e:
-            print(f"Error fetching data from PolymarketWhales: {e}")
+            logger.error("Error fetching data from PolymarketWhales: %s", e)
             return []
     
-    def _fetch_from_subgraph(self, count: int) -> List[TraderInfo]:
+    async def _afetch_from_subgraph(self, client: httpx.AsyncClient, count: int) -> List[TraderInfo]:
         """
         Fetch top traders using Polymarket's subgraph directly
         
         Args:
+            client: Async HTTP client to issue the request with
             count: Number of traders to fetch
             
         Returns:
             List of TraderInfo objects
         """
-        print("Querying Polymarket subgraph for top traders...")
+        logger.info("Querying Polymarket subgraph for top traders...")
         
         endpoint = self.api_endpoints.get("subgraph")
         
         if not endpoint:
-            print("Error: No endpoint configured for Polymarket subgraph")
+            logger.error("No endpoint configured for Polymarket subgraph")
             return []
         
-        # GraphQL query to get top traders by PnL
-        query = """
-        query TopTraders($count: Int) {
-          users(
-            first: $count
-            orderBy: totalPnl
-            orderDirection: desc
-            where: { totalPnl_gt: 10000 }
-          ) {
-            id
-            address
-            totalPnl
-            winCount
-            loseCount
-            totalPositions
-            activePositions
-            totalWins
-            totalLosses
-            currentValue
-          }
-        }
-        """
-        
-        variables = {
-            "count": count
-        }
-        
         try:
             # Make the API request
-            response = httpx.post(
+            async with client.stream(
+                "POST",
                 endpoint,
-                json={"query": query, "variables": variables},
-                timeout=30.0
-            )
+                content=fast_json.dumps({"query": _TOP_TRADERS_QUERY, "variables": {"count": count}}),
+                headers=_JSON_HEADERS
+            ) as response:
+                body = await _read_body(response)
             
             if response.status_code != 200:
-                print(f"API request failed with status code: {response.status_code}")
-                print(f"Response: {response.text}")
+                logger.warning(
+                    "API request failed with status code: %s\nResponse: %s",
+                    response.status_code,
+                    body.decode(errors="replace")
+                )
                 return []
             
             # Parse the response
-            data = response.json()
+            data = fast_json.loads(body)
             users = data.get("data", {}).get("users", [])
             
             if not users:
-                print("No traders found in the API response")
+                logger.warning("No traders found in the API response")
                 return []
             
             # Convert the API response to TraderInfo objects
-            traders = []
-            for user in users:
-                # Calculate win rate
-                win_count = int(user.get("winCount", 0))
-                lose_count = int(user.get("loseCount", 0))
-                total_count = win_count + lose_count
-                win_rate = win_count / total_count if total_count > 0 else 0
-                
-                trader = TraderInfo(
+            return [
+                TraderInfo.from_dict(
+                    user,
+                    _SUBGRAPH_FIELDS,
                     address=user.get("address", user.get("id")),
                     username=None,  # Subgraph doesn't have usernames
-                    pnl=float(user.get("totalPnl", 0)),
-                    win_rate=win_rate,
-                    total_positions=int(user.get("totalPositions", 0)),
-                    active_positions=int(user.get("activePositions", 0)),
-                    total_wins=float(user.get("totalWins", 0)),
-                    total_losses=float(user.get("totalLosses", 0)),
-                    current_value=float(user.get("currentValue", 0))
+                    win_rate=win_rate
                 )
-                traders.append(trader)
-            
-            return traders
+                for user, win_rate in zip(users, _subgraph_win_rates(users))
+            ]
             
         except Exception as e:
-            print(f"Error fetching data from Polymarket subgraph: {e}")
+            logger.error("Error fetching data from Polymarket subgraph: %s", e)
             return []
     
     def _get_placeholder_traders(self, source: str, count: int) -> List[TraderInfo]:
@@ -334,38 +812,20 @@ class PolymarketAnalytics:
         Returns:
             List of TraderInfo objects with placeholder data
         """
-        placeholder_data = []
-        prefix = 100 if source == "polymarketanalytics" else 200 if source == "polymarketwhales" else 300
-        
-        for i in range(1, count + 1):
-            trader = TraderInfo(
-                address=f"0x{i+prefix:040x}",
-                username=f"{source}_trader{i}" if source != "subgraph" else None,
-                pnl=100000 / i,
-                win_rate=0.8 - (i * 0.02),
-                total_positions=100 + i,
-                active_positions=10 + i,
-                total_wins=120000 / i,
-                total_losses=20000 / i,
-                current_value=50000 / i
-            )
-            placeholder_data.append(trader)
-        
-        return placeholder_data
+        # Placeholders are immutable, so identical requests share one cached set
+        return list(_placeholder_traders(source, count))
     
-    def analyze_trader_performance(self, address: str) -> Optional[TraderInfo]:
+    async def _afetch_analytics_trader(self, client: httpx.AsyncClient, address: str) -> Optional[TraderInfo]:
         """
-        Analyze performance of a specific trader
+        Fetch a single trader's metrics from PolymarketAnalytics
         
         Args:
+            client: Async HTTP client to issue the request with
             address: Ethereum address of the trader
             
         Returns:
-            TraderInfo object with trader's performance metrics
+            TraderInfo object, or None if the trader could not be fetched
         """
-        print(f"Analyzing performance for trader {address}...")
-        
-        # Try to get trader info from PolymarketAnalytics first
         try:
             endpoint = f"{self.api_endpoints.get('polymarketanalytics')}/{address}"
             api_key = self.api_keys.get("polymarketanalytics")
@@ -374,85 +834,91 @@ class PolymarketAnalytics:
             if api_key:
                 headers["X-API-KEY"] = api_key
             
-            response = httpx.get(endpoint, headers=headers, timeout=30.0)
+            async with client.stream("GET", endpoint, headers=headers) as response:
+                body = await _read_body(response)
             
             if response.status_code == 200:
-                data = response.json()
+                data = fast_json.loads(body)
                 trader_data = data.get("trader", {})
                 
                 if trader_data:
-                    return TraderInfo(
-                        address=address,
-                        username=trader_data.get("username"),
-                        pnl=float(trader_data.get("pnl", 0)),
-                        win_rate=float(trader_data.get("win_rate", 0)),
-                        total_positions=int(trader_data.get("total_positions", 0)),
-                        active_positions=int(trader_data.get("active_positions", 0)),
-                        total_wins=float(trader_data.get("total_wins", 0)),
-                        total_losses=float(trader_data.get("total_losses", 0)),
-                        current_value=float(trader_data.get("current_value", 0))
-                    )
+                    return TraderInfo.from_dict(trader_data, address=address)
         except Exception as e:
-            print(f"Error getting trader info from PolymarketAnalytics: {e}")
+            logger.error("Error getting trader info from PolymarketAnalytics: %s", e)
+        
+        return None
+    
+    async def _afetch_subgraph_traders(self, client: httpx.AsyncClient, addresses: List[str]) -> Dict[str, TraderInfo]:
+        """
+        Fetch metrics for several traders from the subgraph in a single batched query
+        
+        Args:
+            client: Async HTTP client to issue the request with
+            addresses: Ethereum addresses of the traders
+            
+        Returns:
+            Dict mapping each address found in the subgraph to its TraderInfo
+        """
+        # Subgraph uses lowercase addresses
+        by_id = {address.lower(): address for address in addresses}
         
-        # If PolymarketAnalytics fails, try the subgraph
         try:
             endpoint = self.api_endpoints.get("subgraph")
             
-            query = """
-            query TraderInfo($address: String!) {
-              user(id: $address) {
-                id
-                address
-                totalPnl
-                winCount
-                loseCount
-                totalPositions
-                activePositions
-                totalWins
-                totalLosses
-                currentValue
-              }
-            }
-            """
-            
-            variables = {
-                "address": address.lower()  # Subgraph uses lowercase addresses
-            }
-            
-            response = httpx.post(
+            async with client.stream(
+                "POST",
                 endpoint,
-                json={"query": query, "variables": variables},
-                timeout=30.0
-            )
+                content=fast_json.dumps({"query": _TRADER_INFO_QUERY, "variables": {"addresses": list(by_id)}}),
+                headers=_JSON_HEADERS
+            ) as response:
+                body = await _read_body(response)
             
             if response.status_code == 200:
-                data = response.json()
-                user = data.get("data", {}).get("user")
+                data = fast_json.loads(body)
+                users = data.get("data", {}).get("users") or []
                 
-                if user:
-                    # Calculate win rate
-                    win_count = int(user.get("winCount", 0))
-                    lose_count = int(user.get("loseCount", 0))
-                    total_count = win_count + lose_count
-                    win_rate = win_count / total_count if total_count > 0 else 0
-                    
-                    return TraderInfo(
-                        address=address,
-                        username=None,
-                        pnl=float(user.get("totalPnl", 0)),
-                        win_rate=win_rate,
-                        total_positions=int(user.get("totalPositions", 0)),
-                        active_positions=int(user.get("activePositions", 0)),
-                        total_wins=float(user.get("totalWins", 0)),
-                        total_losses=float(user.get("totalLosses", 0)),
-                        current_value=float(user.get("currentValue", 0))
-                    )
+                traders = {}
+                for user, win_rate in zip(users, _subgraph_win_rates(users)):
+                    address = by_id.get(str(user.get("id", "")).lower())
+                    if address:
+                        traders[address] = TraderInfo.from_dict(
+                            user,
+                            _SUBGRAPH_FIELDS,
+                            address=address,
+                            username=None,
+                            win_rate=win_rate
+                        )
+                return traders
         except Exception as e:
-            print(f"Error getting trader info from subgraph: {e}")
+            logger.error("Error getting trader info from subgraph: %s", e)
         
-        # If both APIs fail, return placeholder data
-        print(f"Warning: Using placeholder data for trader {address}")
+        return {}
+    
+    async def _afetch_subgraph_trader(self, client: httpx.AsyncClient, address: str) -> Optional[TraderInfo]:
+        """
+        Fetch a single trader's metrics from the subgraph
+        
+        Args:
+            client: Async HTTP client to issue the request with
+            address: Ethereum address of the trader
+            
+        Returns:
+            TraderInfo object, or None if the trader could not be fetched
+        """
+        traders = await self._afetch_subgraph_traders(client, [address])
+        return traders.get(address)
+    
+    def _get_placeholder_trader(self, address: str) -> TraderInfo:
+        """
+        Generate placeholder metrics for a trader when no API returned data
+        
+        Args:
+            address: Ethereum address of the trader
+            
+        Returns:
+            TraderInfo object with placeholder data
+        """
+        logger.warning("Using placeholder data for trader %s", address)
         return TraderInfo(
             address=address,
             username=None,
@@ -465,6 +931,130 @@ class PolymarketAnalytics:
             current_value=65432.10
         )
     
+    def _cached_performance(self, address: str) -> Optional[TraderInfo]:
+        """
+        Get a trader's performance from the in-memory cache if it's still fresh
+        
+        Args:
+            address: Ethereum address of the trader
+            
+        Returns:
+            Cached TraderInfo object, or None if missing or expired
+        """
+        entry = self._performance_cache.get(address)
+        if entry is None or time.time() - entry[0] >= self.performance_cache_expiry:
+            return None
+        return entry[1]
+    
+    def analyze_trader_performance(self, address: str) -> Optional[TraderInfo]:
+        """
+        Analyze performance of a specific trader
+        
+        Args:
+            address: Ethereum address of the trader
+            
+        Returns:
+            TraderInfo object with trader's performance metrics
+        """
+        return self._run(self.aanalyze_trader_performance(address))
+    
+    async def aanalyze_trader_performance(self, address: str) -> Optional[TraderInfo]:
+        """
+        Async version of analyze_trader_performance
+        
+        Args:
+            address: Ethereum address of the trader
+            
+        Returns:
+            TraderInfo object with trader's performance metrics
+        """
+        trader = self._cached_performance(address)
+        if trader:
+            return trader
+        
+        logger.info("Analyzing performance for trader %s...", address)
+        
+        # Query both providers at once and take whichever returns data first
+        async with self._client_session() as client:
+            pending = {
+                asyncio.ensure_future(self._afetch_analytics_trader(client, address)),
+                asyncio.ensure_future(self._afetch_subgraph_trader(client, address))
+            }
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        trader = task.result()
+                        if trader:
+                            self._performance_cache[address] = (time.time(), trader)
+                            return trader
+            finally:
+                # Cancel the slower provider and let it unwind before the client closes
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        # If both APIs fail, return placeholder data
+        return self._get_placeholder_trader(address)
+    
+    def analyze_traders_performance(self, addresses: List[str]) -> Dict[str, TraderInfo]:
+        """
+        Analyze performance of several traders at once
+        
+        Args:
+            addresses: Ethereum addresses of the traders
+            
+        Returns:
+            Dict mapping each address to its TraderInfo
+        """
+        return self._run(self.aanalyze_traders_performance(addresses))
+    
+    async def aanalyze_traders_performance(self, addresses: List[str]) -> Dict[str, TraderInfo]:
+        """
+        Analyze performance of several traders at once.
+        
+        PolymarketAnalytics is queried for every address concurrently, together
+        with one batched subgraph query covering all of them. PolymarketAnalytics
+        data is preferred, falling back to the subgraph and then placeholder data.
+        Traders looked up within performance_cache_expiry are served from memory.
+        
+        Args:
+            addresses: Ethereum addresses of the traders
+            
+        Returns:
+            Dict mapping each address to its TraderInfo
+        """
+        results = {}
+        missing = []
+        for address in addresses:
+            trader = self._cached_performance(address)
+            if trader:
+                results[address] = trader
+            else:
+                logger.info("Analyzing performance for trader %s...", address)
+                missing.append(address)
+        
+        if not missing:
+            return results
+        
+        async with self._client_session() as client:
+            *pma_traders, subgraph_traders = await asyncio.gather(
+                *(self._afetch_analytics_trader(client, address) for address in missing),
+                self._afetch_subgraph_traders(client, missing)
+            )
+        
+        fetched_at = time.time()
+        for address, pma_trader in zip(missing, pma_traders):
+            trader = pma_trader or subgraph_traders.get(address)
+            if trader:
+                self._performance_cache[address] = (fetched_at, trader)
+            else:
+                trader = self._get_placeholder_trader(address)
+            results[address] = trader
+        
+        # Keep the caller's ordering
+        return {address: results[address] for address in addresses}
+    
     def get_recommended_traders(self, min_win_rate: float = 0.6, min_pnl: float = 10000) -> List[TraderInfo]:
         """
         Get a list of recommended traders based on performance criteria
@@ -476,35 +1066,51 @@ class PolymarketAnalytics:
         Returns:
             List of recommended traders
         """
-        # Get traders from multiple sources
-        pma_traders = self.get_top_traders(source="polymarketanalytics", count=20)
-        pmw_traders = self.get_top_traders(source="polymarketwhales", count=20)
-        subgraph_traders = self.get_top_traders(source="subgraph", count=20)
-        
-        # Combine and filter
-        all_traders = pma_traders + pmw_traders + subgraph_traders
+        return self._run(
+            self.aget_recommended_traders(min_win_rate=min_win_rate, min_pnl=min_pnl)
+        )
+    
+    async def aget_recommended_traders(self, min_win_rate: float = 0.6, min_pnl: float = 10000) -> List[TraderInfo]:
+        """
+        Async version of get_recommended_traders that queries all sources concurrently
         
-        # Remove duplicates (in real implementation, we'd use address as key)
-        unique_traders = {}
-        for trader in all_traders:
-            if trader.address not in unique_traders:
-                unique_traders[trader.address] = trader
+        Args:
+            min_win_rate: Minimum win rate to consider
+            min_pnl: Minimum profit and loss to consider
+            
+        Returns:
+            List of recommended traders
+        """
+        # Get traders from multiple sources over one shared connection pool
+        async with self._client_session() as client:
+            pma_traders, pmw_traders, subgraph_traders = await asyncio.gather(
+                self.aget_top_traders(source="polymarketanalytics", count=20, client=client),
+                self.aget_top_traders(source="polymarketwhales", count=20, client=client),
+                self.aget_top_traders(source="subgraph", count=20, client=client)
+            )
         
-        # Filter by criteria
-        recommended = [
-            t for t in unique_traders.values()
-            if t.win_rate and t.win_rate >= min_win_rate and 
-               t.pnl and t.pnl >= min_pnl
-        ]
+        # Remove duplicates, keeping the first trader seen for each address.
+        # This runs on exact address keys rather than a fixed-width NumPy
+        # column, which would strip trailing NUL bytes and truncate long ids
+        first_seen = {}
+        for trader in pma_traders + pmw_traders + subgraph_traders:
+            first_seen.setdefault(address_key(trader.address), trader)
+        unique_traders = list(first_seen.values())
         
-        # Sort by PnL descending
-        recommended.sort(key=lambda x: x.pnl if x.pnl else 0, reverse=True)
+        # Combine into one structured array so filtering and sorting run in NumPy
+        traders = np.fromiter(
+            ((t.pnl or 0.0, t.win_rate or 0.0) for t in unique_traders),
+            dtype=_RANKING_DTYPE,
+            count=len(unique_traders)
+        )
         
-        return recommended
+        ranked = _filter_sort(traders["pnl"], traders["win_rate"], min_win_rate, min_pnl)
+        return [unique_traders[i] for i in ranked]
 
 
 def main():
     """Test the analytics client"""
+    logging.basicConfig(level=logging.INFO)
     analytics = PolymarketAnalytics()
     
     # Get top traders from different sources
@@ -1,12 +1,22 @@
 import os
+import asyncio
+import concurrent.futures
 import time
-import json
 import datetime
+import functools
+import heapq
+import json
+import logging
+import logging.handlers
+import mmap
+import queue
 import random
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import BinaryIO, List, Dict, Any, FrozenSet, NamedTuple, Optional, Set, Tuple
 from pathlib import Path
 
 import httpx
+import websockets
 from dotenv import load_dotenv
 
 from py_clob_client.client import ClobClient
@@ -16,6 +26,159 @@ from py_clob_client.order_builder.constants import BUY, SELL
 from agents.polymarket.polymarket import Polymarket
 from agents.polymarket.analytics import PolymarketAnalytics, TraderInfo
 from agents.utils.objects import Trade, SimpleMarket
+from agents.utils import fast_json
+from agents.utils.addresses import address_key, address_from_key
+from agents.utils.files import atomic_write_bytes
+
+# Number of original trade ids remembered to skip trades seen in earlier polls
+MAX_SEEN_TRADE_IDS = 100_000
+
+# How far back to look for trades the first time a trader is checked
+INITIAL_LOOKBACK_SECONDS = 60 * 60
+
+# Maximum number of copy batches, and orders within a batch, placed at the same time
+MAX_CONCURRENT_COPIES = 4
+
+# Public CLOB market channel, used to wake the poll loop when watched markets trade
+MARKET_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# Shortest time between two polls, however busy the watched markets are
+MIN_POLL_INTERVAL_SECONDS = 5
+
+# Markets are followed on the websocket until a watched trader hasn't traded
+# in them for this long - 24 hours
+ASSET_WATCH_SECONDS = 24 * 60 * 60
+
+# Log records buffered for the background writer before new ones are dropped
+LOG_QUEUE_SIZE = 10_000
+
+logger = logging.getLogger(__name__)
+
+
+class CopyDecision(NamedTuple):
+    """Outcome of analyzing a trade, with everything needed to copy it"""
+    should_copy: bool
+    copy_amount: float
+    market_id: str
+    asset_id: str
+    side: str
+    price: float
+    original_trade: Optional[Dict[str, Any]]
+
+
+# Shared decision for every trade that won't be copied
+_SKIP = CopyDecision(False, 0.0, "", "", "", 0.0, None)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of failing when the queue is full"""
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _LogListener(logging.handlers.QueueListener):
+    """QueueListener that detaches its queue handler from the logger when stopped"""
+    
+    def __init__(self, logger: logging.Logger, handler: logging.Handler, *handlers: logging.Handler) -> None:
+        super().__init__(handler.queue, *handlers, respect_handler_level=True)
+        self._logger = logger
+        self._queue_handler = handler
+    
+    def stop(self) -> None:
+        self._logger.removeHandler(self._queue_handler)
+        super().stop()
+
+
+def setup_logging(
+    log_file: str = "data/copy_trader/copy_trader.log",
+    level: int = logging.INFO
+) -> logging.handlers.QueueListener:
+    """
+    Route the project's log records through a bounded queue to the console and
+    a rotating log file, written from a background thread.
+    
+    Only loggers under the "agents" package are captured, so third-party
+    libraries such as httpx keep their own, quieter, defaults.
+    
+    Args:
+        log_file: Path of the log file
+        level: Minimum level to log
+        
+    Returns:
+        The started listener; call stop() on it to flush remaining records
+        and detach the queue handler
+    """
+    log_path = Path(log_file)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+    )
+    console_handler = logging.StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    
+    queue_handler = _DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    agents_logger = logging.getLogger("agents")
+    agents_logger.addHandler(queue_handler)
+    agents_logger.setLevel(level)
+    
+    listener = _LogListener(agents_logger, queue_handler, file_handler, console_handler)
+    listener.start()
+    return listener
+
+
+
+def _dump_config(config: Dict[str, Any]) -> bytes:
+    """
+    Serialize the config in the 4-space layout of the tracked config file.
+    
+    orjson can only indent by two spaces, and the config is small and
+    rarely written, so this stays on the stdlib encoder.
+    
+    Args:
+        config: Configuration settings
+        
+    Returns:
+        The encoded config
+    """
+    return json.dumps(config, indent=4).encode()
+
+
+def _read_history_log(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse a JSONL trade history log through a read-only memory map.
+    
+    Every call parses the log afresh, so each copy trader owns its records
+    and nothing keeps them alive after the trader is gone.
+    
+    Args:
+        path: Path of the log
+        
+    Returns:
+        The parsed records and the number of unreadable lines
+    """
+    # An empty file can't be memory-mapped
+    if path.stat().st_size == 0:
+        return [], 0
+    
+    records = []
+    corrupt_lines = 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b""):
+            if not line.strip():
+                continue
+            try:
+                records.append(fast_json.loads(line))
+            except ValueError:
+                # Most likely a record cut short by a crash mid-write
+                corrupt_lines += 1
+    return records, corrupt_lines
 
 
 class PolymarketCopyTrader:
@@ -24,7 +187,39 @@ class PolymarketCopyTrader:
     Track top traders and mirror their trades.
     """
     
-    def __init__(self, config_path: str = "config/copy_trader_config.json"):
+    __slots__ = (
+        "polymarket", "analytics", "config", "config_path", "_saved_config",
+        "watched_traders", "trade_history", "last_check_time", "data_dir",
+        "_blacklist", "_whitelist", "_whitelist_only", "_copy_buys", "_copy_sells",
+        "_min_amt", "_max_amt", "_copy_pct", "_min_delay", "_max_delay",
+        "_history_fh", "_seen_trade_ids", "_trader_queue", "_copy_holds"
+    )
+    
+    polymarket: Polymarket
+    analytics: PolymarketAnalytics
+    config: Dict[str, Any]
+    config_path: str
+    _saved_config: bytes
+    watched_traders: List[str]
+    trade_history: Dict[str, List[Dict[str, Any]]]
+    last_check_time: Dict[bytes, float]
+    data_dir: Path
+    _blacklist: FrozenSet[str]
+    _whitelist: FrozenSet[str]
+    _whitelist_only: bool
+    _copy_buys: bool
+    _copy_sells: bool
+    _min_amt: float
+    _max_amt: float
+    _copy_pct: float
+    _min_delay: float
+    _max_delay: float
+    _history_fh: Optional[BinaryIO]
+    _seen_trade_ids: "OrderedDict[str, None]"
+    _trader_queue: List[Tuple[float, bytes, str]]
+    _copy_holds: Dict[bytes, List[float]]
+    
+    def __init__(self, config_path: str = "config/copy_trader_config.json") -> None:
         """
         Initialize the copy trader.
         
@@ -36,30 +231,64 @@ class PolymarketCopyTrader:
         self.analytics = PolymarketAnalytics()
         self.config_path = config_path
         self.config = self._load_config(config_path)
+        # Serialized form of the config as it stands on disk
+        self._saved_config = _dump_config(self.config)
         
         # Override config with environment variables if provided
         env_trading_active = os.getenv("COPY_TRADER_ACTIVE", "").lower()
         if env_trading_active in ("true", "1", "yes"):
-            print("Trading activated via environment variable")
+            logger.info("Trading activated via environment variable")
             self.config["trading_active"] = True
         elif env_trading_active in ("false", "0", "no"):
-            print("Trading deactivated via environment variable")
+            logger.info("Trading deactivated via environment variable")
             self.config["trading_active"] = False
         
+        self._apply_config()
+        
         self.watched_traders = self.config.get("watched_traders", [])
         self.trade_history = {}
         self.last_check_time = {}
+        self._history_fh = None
         
-        # Initialize check times for each watched trader
-        for trader in self.watched_traders:
-            self.last_check_time[trader] = datetime.datetime.now() - datetime.timedelta(minutes=60)
+        # Check times before the fetches that found trades whose copies are
+        # still pending, keyed by trader. The saved check time never passes
+        # them, so a restart fetches those trades again
+        self._copy_holds = {}
         
         # Create data directory for storing trade history
         self.data_dir = Path("data/copy_trader")
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+        # Initialize check times (Unix timestamps) for each watched trader,
+        # resuming from the previous run where it's recent enough. Traders are
+        # keyed by their 20 raw address bytes rather than the hex string
+        saved_check_times = self._load_last_check_times()
+        start_time = time.time() - INITIAL_LOOKBACK_SECONDS
+        for trader in self.watched_traders:
+            key = address_key(trader)
+            self.last_check_time[key] = max(saved_check_times.get(key, start_time), start_time)
+        
+        # Watched traders ordered by last check time, least recently checked first.
+        # Entries whose time no longer matches last_check_time are stale and skipped
+        self._trader_queue = [
+            (self.last_check_time[address_key(trader)], address_key(trader), trader)
+            for trader in self.watched_traders
+        ]
+        heapq.heapify(self._trader_queue)
+        
         # Load existing trade history if it exists
         self._load_trade_history()
+        
+        # Trades that were already copied must not be processed again
+        self._seen_trade_ids = OrderedDict()
+        for market_trades in self.trade_history.values():
+            for record in market_trades:
+                trade_id = record.get("original_trade", {}).get("id")
+                if trade_id is not None:
+                    self._mark_seen(trade_id)
+        
+        # New copy trades are appended to the history log one record at a time
+        self._history_fh = open(self.data_dir / "trade_history.jsonl", "ab")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """
@@ -78,8 +307,7 @@ class PolymarketCopyTrader:
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            return fast_json.loads(config_file.read_bytes())
         else:
             # Default configuration
             default_config = {
@@ -111,29 +339,118 @@ class PolymarketCopyTrader:
             }
             
             # Save default configuration
-            with open(config_file, 'w') as f:
-                json.dump(default_config, f, indent=4)
+            atomic_write_bytes(config_file, _dump_config(default_config))
             
             return default_config
     
     def _save_config(self) -> None:
-        """Save configuration to disk"""
-        config_file = Path(self.config_path)
-        with open(config_file, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        """Save configuration to disk, skipping the write if nothing changed"""
+        data = _dump_config(self.config)
+        if data != self._saved_config:
+            atomic_write_bytes(Path(self.config_path), data)
+            self._saved_config = data
+        self._apply_config()
+    
+    def _apply_config(self) -> None:
+        """Cache the settings read for every processed trade"""
+        self._blacklist = frozenset(self.config.get("blacklisted_markets", ()))
+        self._whitelist = frozenset(self.config.get("whitelisted_markets", ()))
+        self._whitelist_only = self.config.get("whitelist_only", False)
+        self._copy_buys = self.config.get("copy_buys", True)
+        self._copy_sells = self.config.get("copy_sells", True)
+        self._min_amt = self.config.get("min_amount_to_copy", 0)
+        self._max_amt = self.config.get("max_amount_to_copy", 500)
+        self._copy_pct = self.config.get("copy_percentage", 0.1)
+        self._min_delay = self.config.get("min_copy_delay", 30)
+        self._max_delay = self.config.get("max_copy_delay", 300)
     
     def _load_trade_history(self) -> None:
         """Load existing trade history from disk"""
-        history_file = self.data_dir / "trade_history.json"
+        history_file = self.data_dir / "trade_history.jsonl"
+        legacy_file = self.data_dir / "trade_history.json"
+        
         if history_file.exists():
-            with open(history_file, 'r') as f:
-                self.trade_history = json.load(f)
+            records, corrupt_lines = _read_history_log(history_file)
+            for record in records:
+                self.trade_history.setdefault(record["market_id"], []).append(record)
+            
+            if corrupt_lines:
+                logger.warning("Skipped %d unreadable trade history records", corrupt_lines)
+                self._save_trade_history()
+        elif legacy_file.exists():
+            # Convert history saved in the old single-document format
+            self.trade_history = fast_json.loads(legacy_file.read_bytes())
+            self._save_trade_history()
     
     def _save_trade_history(self) -> None:
-        """Save trade history to disk"""
-        history_file = self.data_dir / "trade_history.json"
-        with open(history_file, 'w') as f:
-            json.dump(self.trade_history, f, indent=4)
+        """Rewrite the whole trade history log from memory"""
+        history_file = self.data_dir / "trade_history.jsonl"
+        atomic_write_bytes(history_file, b"".join(
+            fast_json.dumps(record) + b"\n"
+            for market_trades in self.trade_history.values()
+            for record in market_trades
+        ))
+        
+        # The log was replaced, so appends must go to the new file
+        if self._history_fh is not None:
+            self._history_fh.close()
+            self._history_fh = open(history_file, "ab")
+    
+    def _append_trade_history(self, record: Dict[str, Any]) -> None:
+        """
+        Append a single record to the trade history log.
+        
+        Args:
+            record: The trade record to persist
+        """
+        self._history_fh.write(fast_json.dumps(record) + b"\n")
+        self._history_fh.flush()
+    
+    def close(self) -> None:
+        """Close the trade history log and the analytics client"""
+        self._history_fh.close()
+        self.analytics.close()
+    
+    def _load_last_check_times(self) -> Dict[bytes, float]:
+        """Load the per-trader check times saved by a previous run"""
+        last_check_file = self.data_dir / "last_check.json"
+        if not last_check_file.exists():
+            return {}
+        
+        try:
+            saved = fast_json.loads(last_check_file.read_bytes())
+        except ValueError:
+            logger.warning("Ignoring unreadable last check times")
+            return {}
+        
+        return {address_key(trader): checked_at for trader, checked_at in saved.items()}
+    
+    def _save_last_check_times(self) -> None:
+        """Save the per-trader check times to disk, held back for pending copies"""
+        last_check_file = self.data_dir / "last_check.json"
+        atomic_write_bytes(last_check_file, fast_json.dumps({
+            address_from_key(key): min((checked_at, *self._copy_holds.get(key, ())))
+            for key, checked_at in self.last_check_time.items()
+        }))
+    
+    def _release_copy_holds(self, holds: List[Tuple[bytes, float]], task: "asyncio.Task[None]") -> None:
+        """
+        Drop the check time holds of a finished copy batch.
+        
+        Holds of a cancelled batch are kept, so its trades are fetched again
+        after a restart.
+        
+        Args:
+            holds: (trader key, check time) pairs taken for the batch
+            task: The finished copy task
+        """
+        if task.cancelled():
+            return
+        for key, checked_at in holds:
+            key_holds = self._copy_holds[key]
+            key_holds.remove(checked_at)
+            if not key_holds:
+                del self._copy_holds[key]
     
     def add_watched_trader(self, trader_address: str) -> None:
         """
@@ -144,13 +461,15 @@ class PolymarketCopyTrader:
         """
         if trader_address not in self.watched_traders:
             self.watched_traders.append(trader_address)
-            self.last_check_time[trader_address] = datetime.datetime.now() - datetime.timedelta(minutes=60)
+            key = address_key(trader_address)
+            self.last_check_time[key] = time.time() - INITIAL_LOOKBACK_SECONDS
+            heapq.heappush(self._trader_queue, (self.last_check_time[key], key, trader_address))
             self.config["watched_traders"] = self.watched_traders
             
             # Save updated configuration
             self._save_config()
             
-            print(f"Added trader {trader_address} to watch list")
+            logger.info("Added trader %s to watch list", trader_address)
     
     def remove_watched_trader(self, trader_address: str) -> None:
         """
@@ -161,29 +480,28 @@ class PolymarketCopyTrader:
         """
         if trader_address in self.watched_traders:
             self.watched_traders.remove(trader_address)
-            if trader_address in self.last_check_time:
-                del self.last_check_time[trader_address]
+            self.last_check_time.pop(address_key(trader_address), None)
             
             self.config["watched_traders"] = self.watched_traders
             
             # Save updated configuration
             self._save_config()
             
-            print(f"Removed trader {trader_address} from watch list")
+            logger.info("Removed trader %s from watch list", trader_address)
     
     def update_traders_from_analytics(self) -> None:
         """
         Update the watched traders list using analytics recommendations
         """
         if not self.config.get("analytics", {}).get("enabled", False):
-            print("Analytics-based trader updates are disabled in config")
+            logger.info("Analytics-based trader updates are disabled in config")
             return
         
         min_win_rate = self.config.get("analytics", {}).get("min_win_rate", 0.7)
         min_pnl = self.config.get("analytics", {}).get("min_pnl", 50000)
         max_traders = self.config.get("analytics", {}).get("max_auto_traders", 5)
         
-        print(f"Updating traders from analytics (min win rate: {min_win_rate:.1%}, min PnL: ${min_pnl})")
+        logger.info("Updating traders from analytics (min win rate: %.1f%%, min PnL: $%s)", min_win_rate * 100, min_pnl)
         
         # Get recommended traders from analytics
         recommended = self.analytics.get_recommended_traders(
@@ -197,9 +515,12 @@ class PolymarketCopyTrader:
             if trader.address not in self.watched_traders and added_count < max_traders:
                 self.add_watched_trader(trader.address)
                 added_count += 1
-                print(f"Auto-added trader {trader.address} (PnL: ${trader.pnl:.2f}, Win Rate: {trader.win_rate:.2%})")
+                logger.info(
+                    "Auto-added trader %s (PnL: $%.2f, Win Rate: %.2f%%)",
+                    trader.address, trader.pnl, trader.win_rate * 100
+                )
         
-        print(f"Added {added_count} new traders to watch list")
+        logger.info("Added %d new traders to watch list", added_count)
     
     def should_update_traders(self) -> bool:
         """
@@ -238,6 +559,21 @@ class PolymarketCopyTrader:
         """
         Get recent trades for a specific trader.
         
+        Args:
+            trader_address: The Ethereum address of the trader
+            
+        Returns:
+            List of trades by the trader
+        """
+        trades = asyncio.run(self.aget_recent_trades(trader_address))
+        self._save_last_check_times()
+        return trades
+    
+    async def aget_recent_trades(self, trader_address: str) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_recent_trades. The maker and taker lookups are
+        issued concurrently.
+        
         Args:
             trader_address: The Ethereum address of the trader
             
@@ -246,39 +582,113 @@ class PolymarketCopyTrader:
         """
         try:
             # Use last check time to only get recent trades
-            last_check = self.last_check_time.get(trader_address, 
-                                                datetime.datetime.now() - datetime.timedelta(minutes=60))
-            
-            # Convert to Unix timestamp
-            after_timestamp = int(last_check.timestamp())
-            
-            # Get trades where the trader is the maker
-            trades_as_maker = self.polymarket.client.get_trades(
-                TradeParams(
-                    maker_address=trader_address,
-                    after=str(after_timestamp)
-                )
-            )
+            key = address_key(trader_address)
+            last_check = self.last_check_time.get(key, time.time() - INITIAL_LOOKBACK_SECONDS)
+            after_timestamp = int(last_check)
             
-            # Get trades where the trader is the taker
-            trades_as_taker = self.polymarket.client.get_trades(
-                TradeParams(
-                    taker=trader_address,
-                    after=str(after_timestamp)
-                )
+            # py_clob_client is blocking, so each request runs in a worker thread
+            trades_as_maker, trades_as_taker = await asyncio.gather(
+                # Trades where the trader is the maker
+                asyncio.to_thread(
+                    self.polymarket.client.get_trades,
+                    TradeParams(maker_address=trader_address, after=str(after_timestamp))
+                ),
+                # Trades where the trader is the taker
+                asyncio.to_thread(
+                    self.polymarket.client.get_trades,
+                    TradeParams(taker=trader_address, after=str(after_timestamp))
+                ),
             )
             
             # Update the last check time for this trader
-            self.last_check_time[trader_address] = datetime.datetime.now()
+            self.last_check_time[key] = time.time()
             
             # Combine and return all trades
             return trades_as_maker + trades_as_taker
             
         except Exception as e:
-            print(f"Error getting recent trades for {trader_address}: {e}")
+            logger.error("Error getting recent trades for %s: %s", trader_address, e)
             return []
     
-    def analyze_trade(self, trade: Dict[str, Any]) -> Dict[str, Any]:
+    async def aget_recent_trades_for_traders(self, trader_addresses: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Get recent trades for several traders at once.
+        
+        Args:
+            trader_addresses: The Ethereum addresses of the traders
+            
+        Returns:
+            List of trade lists, in the same order as trader_addresses
+        """
+        return await asyncio.gather(*(
+            self.aget_recent_trades(trader) for trader in trader_addresses
+        ))
+    
+    def _traders_by_last_check(self, checked_before: float = float("inf")) -> List[str]:
+        """
+        Take watched traders off the check queue, least recently checked first.
+        
+        Args:
+            checked_before: Only take traders last checked at or before this time
+            
+        Returns:
+            Addresses of the traders taken off the queue
+        """
+        traders = []
+        while self._trader_queue and self._trader_queue[0][0] <= checked_before:
+            checked_at, key, trader = heapq.heappop(self._trader_queue)
+            if self.last_check_time.get(key) == checked_at:
+                traders.append(trader)
+        return traders
+    
+    def _next_check_time(self) -> Optional[float]:
+        """
+        Get the last check time of the least recently checked trader on the queue.
+        
+        Returns:
+            The check time, or None if the queue is empty
+        """
+        # Drop stale entries so the head is a current one
+        while self._trader_queue:
+            checked_at, key, _ = self._trader_queue[0]
+            if self.last_check_time.get(key) == checked_at:
+                return checked_at
+            heapq.heappop(self._trader_queue)
+        return None
+    
+    def _requeue_traders(self, traders: List[str]) -> None:
+        """
+        Put checked traders back on the check queue.
+        
+        Args:
+            traders: Addresses of the traders that were checked
+        """
+        for trader in traders:
+            key = address_key(trader)
+            checked_at = self.last_check_time.get(key)
+            if checked_at is not None:
+                heapq.heappush(self._trader_queue, (checked_at, key, trader))
+    
+    def _mark_seen(self, trade_id: str) -> bool:
+        """
+        Remember a trade id, evicting the oldest once the limit is reached.
+        
+        Args:
+            trade_id: The ID of the original trade
+            
+        Returns:
+            True if the trade had not been seen before
+        """
+        if trade_id in self._seen_trade_ids:
+            self._seen_trade_ids.move_to_end(trade_id)
+            return False
+        
+        self._seen_trade_ids[trade_id] = None
+        if len(self._seen_trade_ids) > MAX_SEEN_TRADE_IDS:
+            self._seen_trade_ids.popitem(last=False)
+        return True
+    
+    def analyze_trade(self, trade: Dict[str, Any]) -> CopyDecision:
         """
         Analyze a trade to determine if it should be copied.
         
@@ -286,95 +696,134 @@ class PolymarketCopyTrader:
             trade: The trade to analyze
             
         Returns:
-            Dict with analysis results and copy decision
+            CopyDecision for the trade; trades that won't be copied all get _SKIP
         """
-        # Check if the trade meets the minimum amount requirement
-        size = float(trade.get("size", 0))
-        price = float(trade.get("price", 0))
         side = trade.get("side", "")
         market_id = trade.get("market", "")
-        asset_id = trade.get("asset_id", "")
+        
+        # Market and side filters reject most trades, so check them before
+        # parsing any numbers
+        if (market_id in self._blacklist or
+                (self._whitelist_only and market_id not in self._whitelist) or
+                not ((side == "BUY" and self._copy_buys) or
+                     (side == "SELL" and self._copy_sells))):
+            return _SKIP
+        
+        size = float(trade.get("size", 0))
+        price = float(trade.get("price", 0))
         
         # Calculate trade value in USD
         trade_value = size * price if side == "SELL" else size
         
-        # Check if the trade meets our copying criteria
-        should_copy = (
-            trade_value >= self.config.get("min_amount_to_copy", 0) and
-            (market_id not in self.config.get("blacklisted_markets", [])) and
-            (not self.config.get("whitelist_only", False) or 
-             market_id in self.config.get("whitelisted_markets", [])) and
-            ((side == "BUY" and self.config.get("copy_buys", True)) or
-             (side == "SELL" and self.config.get("copy_sells", True)))
+        # Check if the trade meets the minimum amount requirement
+        if trade_value < self._min_amt:
+            return _SKIP
+        
+        # Calculate the amount to copy based on percentage, applying the max bound
+        copy_amount = min(trade_value * self._copy_pct, self._max_amt)
+        
+        return CopyDecision(
+            True,
+            copy_amount,
+            market_id,
+            trade.get("asset_id", ""),
+            side,
+            price,
+            trade
         )
+    
+    def build_copy_order(self, trade_analysis: CopyDecision) -> OrderArgs:
+        """
+        Build the order that copies an analyzed trade.
         
-        # Calculate the amount to copy based on percentage
-        copy_percentage = self.config.get("copy_percentage", 0.1)
-        copy_amount = trade_value * copy_percentage
+        Args:
+            trade_analysis: Copy decision for the trade
+            
+        Returns:
+            Order arguments for the copy
+        """
+        side = BUY if trade_analysis.side == "BUY" else SELL
+        price = trade_analysis.price
         
-        # Apply min/max bounds
-        max_amount = self.config.get("max_amount_to_copy", 500)
-        copy_amount = min(copy_amount, max_amount)
+        # Calculate size to buy
+        copy_amount = trade_analysis.copy_amount
+        size = copy_amount if side == SELL else copy_amount / price
         
-        return {
-            "original_trade": trade,
-            "should_copy": should_copy,
-            "copy_amount": copy_amount,
-            "market_id": market_id,
-            "asset_id": asset_id,
-            "side": side,
-            "price": price
-        }
+        return OrderArgs(price=price, size=size, side=side, token_id=trade_analysis.asset_id)
     
-    def execute_copy_trade(self, trade_analysis: Dict[str, Any]) -> Optional[str]:
+    def execute_copy_trade(self, trade_analysis: CopyDecision) -> Optional[str]:
         """
         Execute a copy of the analyzed trade.
         
         Args:
-            trade_analysis: The analyzed trade data
+            trade_analysis: Copy decision for the trade
             
         Returns:
             Trade ID if successful, None otherwise
         """
+        return self.execute_copy_trades([trade_analysis])[0]
+    
+    def execute_copy_trades(self, trade_analyses: List[CopyDecision]) -> List[Optional[str]]:
+        """
+        Execute copies of several analyzed trades.
+        
+        All orders are signed up front and then submitted concurrently.
+        
+        Args:
+            trade_analyses: Copy decisions for the trades
+            
+        Returns:
+            Trade ID for each analysis if successful, None otherwise
+        """
         # Check if trading is active in the configuration
         if not self.config.get("trading_active", False):
-            print("Trading is not active. Set 'trading_active' to True in the config to execute trades.")
+            logger.warning("Trading is not active. Set 'trading_active' to True in the config to execute trades.")
+            return [None] * len(trade_analyses)
+        
+        signed_orders = []
+        for trade_analysis in trade_analyses:
+            try:
+                signed_orders.append(self.polymarket.client.create_order(self.build_copy_order(trade_analysis)))
+            except Exception as e:
+                logger.error("Error creating copy order: %s", e)
+                signed_orders.append(None)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_COPIES) as pool:
+            return list(pool.map(self._post_copy_order, trade_analyses, signed_orders))
+    
+    def _post_copy_order(self, trade_analysis: CopyDecision, signed_order: Any) -> Optional[str]:
+        """
+        Submit a signed copy order and record it on success.
+        
+        Args:
+            trade_analysis: Copy decision for the trade
+            signed_order: The signed order, or None if signing failed
+            
+        Returns:
+            Trade ID if successful, None otherwise
+        """
+        if signed_order is None:
             return None
         
         try:
-            # Prepare order parameters
-            asset_id = trade_analysis["asset_id"]
-            side = BUY if trade_analysis["side"] == "BUY" else SELL
-            price = trade_analysis["price"]
-            
-            # Calculate size to buy
-            copy_amount = trade_analysis["copy_amount"]
-            size = copy_amount if side == SELL else copy_amount / price
-            
-            # Execute the order
-            trade_id = self.polymarket.execute_order(
-                price=price,
-                size=size,
-                side=side,
-                token_id=asset_id
-            )
+            trade_id = self.polymarket.client.post_order(signed_order)
             
             # Record this trade in our history
             self._record_copy_trade(trade_analysis, trade_id)
             
-            print(f"Successfully copied trade with ID: {trade_id}")
+            logger.info("Successfully copied trade with ID: %s", trade_id)
             return trade_id
             
         except Exception as e:
-            print(f"Error executing copy trade: {e}")
+            logger.error("Error executing copy trade: %s", e)
             return None
     
-    def _record_copy_trade(self, trade_analysis: Dict[str, Any], trade_id: str) -> None:
+    def _record_copy_trade(self, trade_analysis: CopyDecision, trade_id: str) -> None:
         """
         Record a copied trade in the trade history.
         
         Args:
-            trade_analysis: The analyzed trade data
+            trade_analysis: Copy decision for the trade
             trade_id: The ID of the executed trade
         """
         timestamp = datetime.datetime.now().isoformat()
@@ -382,97 +831,361 @@ class PolymarketCopyTrader:
         # Create record
         record = {
             "timestamp": timestamp,
-            "original_trade": trade_analysis["original_trade"],
+            "original_trade": trade_analysis.original_trade,
             "copied_trade_id": trade_id,
-            "copy_amount": trade_analysis["copy_amount"],
-            "market_id": trade_analysis["market_id"],
-            "asset_id": trade_analysis["asset_id"],
-            "side": trade_analysis["side"],
-            "price": trade_analysis["price"]
+            "copy_amount": trade_analysis.copy_amount,
+            "market_id": trade_analysis.market_id,
+            "asset_id": trade_analysis.asset_id,
+            "side": trade_analysis.side,
+            "price": trade_analysis.price
         }
         
-        # Add to trade history
-        if trade_analysis["market_id"] not in self.trade_history:
-            self.trade_history[trade_analysis["market_id"]] = []
+        # Add to trade history (copies may be recorded from several threads)
+        self.trade_history.setdefault(trade_analysis.market_id, []).append(record)
         
-        self.trade_history[trade_analysis["market_id"]].append(record)
-        
-        # Save updated trade history
-        self._save_trade_history()
+        # Persist just the new record
+        self._append_trade_history(record)
     
     def monitor_traders(self) -> None:
         """
         Main monitoring loop that checks for new trades by watched traders
         and copies them according to the configuration.
         """
-        print(f"Starting to monitor {len(self.watched_traders)} traders.")
+        asyncio.run(self.amonitor_traders())
+    
+    async def amonitor_traders(self) -> None:
+        """
+        Async variant of monitor_traders. Copies are scheduled as background
+        tasks, so waiting out one copy delay doesn't hold up polling.
+        """
+        logger.info("Starting to monitor %d traders.", len(self.watched_traders))
+        
+        copy_slots = asyncio.Semaphore(MAX_CONCURRENT_COPIES)
+        # Scheduled copy batches, with the IDs of the trades they copy
+        pending_copies: Dict["asyncio.Task[None]", List[str]] = {}
+        
+        # Markets the watched traders recently traded in are streamed over the
+        # websocket, and a trade there triggers an early poll of just the
+        # traders active in that market
+        market_activity = asyncio.Event()
+        assets_changed = asyncio.Event()
+        asset_traders: Dict[str, Set[str]] = {}
+        asset_traded_at: Dict[str, float] = {}
+        active_assets: Set[str] = set()
+        woken_traders: Set[str] = set()
+        stream_task = asyncio.create_task(
+            self._watch_market_activity(asset_traders, assets_changed, market_activity, active_assets)
+        )
+        
+        # Trader polls may not exceed one per watched trader per polling
+        # interval in total, however busy the markets are, so early polls
+        # draw on a budget that refills at that rate
+        loop = asyncio.get_running_loop()
+        poll_budget = float("inf")
+        budget_updated_at = loop.time()
+        last_poll_at = float("-inf")
+        check_times_saved_at = loop.time()
         
         # Check if we need to update traders from analytics first
         if self.should_update_traders():
-            print("Auto-update of traders is enabled. Updating watched traders...")
-            self.update_traders_from_analytics()
+            logger.info("Auto-update of traders is enabled. Updating watched traders...")
+            await asyncio.to_thread(self.update_traders_from_analytics)
             self.mark_traders_updated()
         
-        while True:
-            try:
-                # Check if we should update the traders list
-                if self.should_update_traders():
-                    print("Auto-update interval reached. Updating watched traders...")
-                    self.update_traders_from_analytics()
-                    self.mark_traders_updated()
-                
-                # If we have no traders to watch, sleep and retry
-                if not self.watched_traders:
-                    print("No traders in watch list. Please add traders or enable auto-update.")
-                    time.sleep(60)
-                    continue
-                
-                # Shuffle the list of traders to avoid always checking in the same order
-                traders_to_check = self.watched_traders.copy()
-                random.shuffle(traders_to_check)
-                
-                for trader in traders_to_check:
-                    print(f"Checking for new trades by {trader}...")
+        try:
+            while True:
+                try:
+                    # Check if we should update the traders list
+                    if self.should_update_traders():
+                        logger.info("Auto-update interval reached. Updating watched traders...")
+                        await asyncio.to_thread(self.update_traders_from_analytics)
+                        self.mark_traders_updated()
+                    
+                    # If we have no traders to watch, sleep and retry
+                    if not self.watched_traders:
+                        logger.warning("No traders in watch list. Please add traders or enable auto-update.")
+                        await asyncio.sleep(60)
+                        continue
+                    
+                    interval = self.config.get("polling_interval", 60)
+                    trader_count = len(self.watched_traders)
+                    now = loop.time()
+                    poll_budget = min(
+                        trader_count,
+                        poll_budget + (now - budget_updated_at) * trader_count / interval
+                    )
+                    budget_updated_at = now
                     
-                    # Get recent trades for this trader
-                    recent_trades = self.get_recent_trades(trader)
-                    print(f"Found {len(recent_trades)} recent trades.")
+                    # Stop following markets no watched trader has traded in lately
+                    if self._prune_watched_assets(asset_traders, asset_traded_at):
+                        assets_changed.set()
                     
-                    # Process each trade
-                    for trade in recent_trades:
-                        # Analyze the trade
-                        analysis = self.analyze_trade(trade)
+                    # Traders due a regular check, least recently checked first,
+                    # then traders whose markets have traded since the last poll
+                    due = self._traders_by_last_check(time.time() - interval)
+                    for asset_id in active_assets:
+                        woken_traders.update(asset_traders.get(asset_id, ()))
+                    active_assets.clear()
+                    woken_traders.intersection_update(self.watched_traders)
+                    woken_traders.difference_update(due)
+                    candidates = due + list(woken_traders)
+                    
+                    # Anything over the budget waits for a later cycle
+                    traders_to_check = candidates[:int(poll_budget)]
+                    self._requeue_traders(due[len(traders_to_check):])
+                    woken_traders.difference_update(traders_to_check)
+                    poll_budget -= len(traders_to_check)
+                    
+                    if traders_to_check:
+                        last_poll_at = loop.time()
+                        await self._poll_traders(
+                            traders_to_check, set(due), copy_slots, pending_copies,
+                            asset_traders, asset_traded_at, assets_changed
+                        )
                         
-                        # If we should copy it, execute the trade
-                        if analysis["should_copy"]:
-                            print(f"Copying trade: {trade['id']}")
-                            
-                            # Add random delay before copying
-                            min_delay = self.config.get("min_copy_delay", 30)
-                            max_delay = self.config.get("max_copy_delay", 300)
-                            delay = min_delay + (max_delay - min_delay) * random.random()
-                            print(f"Waiting {delay:.2f} seconds before executing copy...")
-                            time.sleep(delay)
-                            
-                            # Execute the copy trade
-                            trade_id = self.execute_copy_trade(analysis)
-                            
-                            if trade_id:
-                                print(f"Successfully copied trade as {trade_id}")
-                            else:
-                                print("Failed to copy trade.")
-                        else:
-                            print(f"Skipping trade {trade['id']}: does not meet copy criteria")
+                        # Skipping a save only means refetching a little more
+                        # after a restart, so the check times are written at
+                        # most once per polling interval
+                        if loop.time() - check_times_saved_at >= interval:
+                            self._save_last_check_times()
+                            check_times_saved_at = loop.time()
+                    
+                    # Sleep until deferred traders can be afforded again, or
+                    # else until the next trader is due, or a watched market
+                    # trades. Deferred traders are overdue, so the next check
+                    # time alone would not wait at all.
+                    if len(candidates) > len(traders_to_check):
+                        timeout = (1 - poll_budget) * interval / trader_count
+                    else:
+                        next_check = self._next_check_time()
+                        timeout = interval if next_check is None else next_check + interval - time.time()
+                    logger.debug("Sleeping for up to %.1f seconds...", max(timeout, 0))
+                    if timeout > 0 and not market_activity.is_set():
+                        try:
+                            await asyncio.wait_for(market_activity.wait(), timeout=timeout)
+                            logger.debug("Activity in a watched market, checking for new trades...")
+                        except asyncio.TimeoutError:
+                            pass
+                    
+                    # Let a burst of market activity settle into one poll
+                    await asyncio.sleep(max(last_poll_at + MIN_POLL_INTERVAL_SECONDS - loop.time(), 0))
+                    market_activity.clear()
+                    
+                except Exception as e:
+                    logger.error("Error in monitoring loop: %s", e)
+                    # Sleep for a bit before retrying
+                    await asyncio.sleep(30)
+        finally:
+            stream_task.cancel()
+            
+            # Copies still waiting out their delay are dropped; their trades
+            # stay held in the saved check times, so the next run copies them
+            if pending_copies:
+                logger.warning(
+                    "Stopping with %d copies still pending, they will be retried on the next run: %s",
+                    sum(map(len, pending_copies.values())),
+                    ", ".join(trade_id for ids in pending_copies.values() for trade_id in ids)
+                )
+                tasks = list(pending_copies)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self._save_last_check_times()
+    
+    async def _poll_traders(
+        self,
+        traders: List[str],
+        dequeued: Set[str],
+        copy_slots: asyncio.Semaphore,
+        pending_copies: Dict["asyncio.Task[None]", List[str]],
+        asset_traders: Dict[str, Set[str]],
+        asset_traded_at: Dict[str, float],
+        assets_changed: asyncio.Event
+    ) -> None:
+        """
+        Fetch new trades for some traders and schedule copies of those that qualify.
+        
+        Args:
+            traders: Addresses of the traders to check
+            dequeued: Those of the traders that were taken off the check queue
+            copy_slots: Semaphore bounding how many copy batches are placed at once
+            pending_copies: Scheduled copy batches, with the IDs of the trades they copy
+            asset_traders: Watched traders seen trading each asset, updated in place
+            asset_traded_at: When a watched trader last traded each asset, updated in place
+            assets_changed: Set when a new asset is added to asset_traders
+        """
+        # Fetch recent trades for every trader concurrently
+        logger.info("Checking for new trades by %d traders...", len(traders))
+        fetched_after = [
+            self.last_check_time.get(address_key(trader), time.time() - INITIAL_LOOKBACK_SECONDS)
+            for trader in traders
+        ]
+        try:
+            all_recent_trades = await self.aget_recent_trades_for_traders(traders)
+        finally:
+            # Traders still on the queue only need a new entry once their check time moved
+            self._requeue_traders([
+                trader for trader, after in zip(traders, fetched_after)
+                if trader in dequeued or self.last_check_time.get(address_key(trader)) != after
+            ])
+        
+        to_copy: List[CopyDecision] = []
+        holds: List[Tuple[bytes, float]] = []
+        for trader, after, recent_trades in zip(traders, fetched_after, all_recent_trades):
+            logger.debug("Found %d recent trades by %s.", len(recent_trades), trader)
+            copies_before = len(to_copy)
+            
+            # Process each trade
+            for trade in recent_trades:
+                # Self-trades show up as both maker and taker, and the
+                # after= filter can return trades from the last poll
+                if not self._mark_seen(trade["id"]):
+                    continue
+                
+                # Follow this market on the websocket, waking this trader's polls
+                asset_id = trade.get("asset_id")
+                if asset_id:
+                    if asset_id not in asset_traders:
+                        asset_traders[asset_id] = set()
+                        assets_changed.set()
+                    asset_traders[asset_id].add(trader)
+                    asset_traded_at[asset_id] = time.time()
                 
-                # Sleep for the configured polling interval
-                interval = self.config.get("polling_interval", 60)
-                print(f"Sleeping for {interval} seconds...")
-                time.sleep(interval)
+                # Analyze the trade
+                analysis = self.analyze_trade(trade)
                 
+                # If we should copy it, add it to this cycle's batch
+                if analysis.should_copy:
+                    logger.info("Copying trade: %s", trade["id"])
+                    to_copy.append(analysis)
+                elif logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Skipping trade %s: does not meet copy criteria", trade["id"])
+            
+            # Hold this trader's saved check time until the copies are placed
+            if len(to_copy) > copies_before:
+                key = address_key(trader)
+                self._copy_holds.setdefault(key, []).append(after)
+                holds.append((key, after))
+        
+        # Schedule this cycle's copies as one batch
+        if to_copy:
+            task = asyncio.create_task(self._delayed_copy(to_copy, copy_slots))
+            pending_copies[task] = [d.original_trade["id"] for d in to_copy]
+            task.add_done_callback(functools.partial(self._release_copy_holds, holds))
+            task.add_done_callback(lambda task: pending_copies.pop(task, None))
+    
+    def _prune_watched_assets(
+        self,
+        asset_traders: Dict[str, Set[str]],
+        asset_traded_at: Dict[str, float]
+    ) -> bool:
+        """
+        Forget assets no watched trader has traded within ASSET_WATCH_SECONDS,
+        and traders that are no longer watched.
+        
+        Args:
+            asset_traders: Watched traders seen trading each asset, pruned in place
+            asset_traded_at: When a watched trader last traded each asset, pruned in place
+            
+        Returns:
+            True if any asset was removed
+        """
+        cutoff = time.time() - ASSET_WATCH_SECONDS
+        watched = set(self.watched_traders)
+        stale = []
+        for asset_id, traders in asset_traders.items():
+            traders.intersection_update(watched)
+            if not traders or asset_traded_at[asset_id] < cutoff:
+                stale.append(asset_id)
+        for asset_id in stale:
+            del asset_traders[asset_id]
+            del asset_traded_at[asset_id]
+        return bool(stale)
+    
+    async def _watch_market_activity(
+        self,
+        watched_assets: Dict[str, Set[str]],
+        assets_changed: asyncio.Event,
+        market_activity: asyncio.Event,
+        active_assets: Set[str]
+    ) -> None:
+        """
+        Stream trades in the watched markets and flag activity to the poll loop.
+        
+        The CLOB user channel only reports the authenticated account's own
+        trades, so other traders' fills are detected from the public market
+        channel and then picked up by polling.
+        
+        Args:
+            watched_assets: Asset IDs to subscribe to, as keys
+            assets_changed: Set when watched_assets changes, to resubscribe
+            market_activity: Set whenever one of the markets trades
+            active_assets: Asset IDs that traded are added here for the poll loop
+        """
+        while True:
+            # Nothing to subscribe to until the poll loop adds an asset
+            assets_changed.clear()
+            if not watched_assets:
+                await assets_changed.wait()
+                continue
+            
+            try:
+                async with websockets.connect(MARKET_WS_URL) as ws:
+                    await ws.send(fast_json.dumps({
+                        "assets_ids": list(watched_assets),
+                        "type": "market"
+                    }).decode())
+                    
+                    changed = asyncio.ensure_future(assets_changed.wait())
+                    try:
+                        while True:
+                            message = asyncio.ensure_future(ws.recv())
+                            done, _ = await asyncio.wait(
+                                {message, changed}, return_when=asyncio.FIRST_COMPLETED
+                            )
+                            if changed in done:
+                                # Reconnect with the new set of assets
+                                message.cancel()
+                                break
+                            
+                            events = fast_json.loads(message.result())
+                            if isinstance(events, dict):
+                                events = [events]
+                            for event in events:
+                                asset_id = event.get("asset_id")
+                                if event.get("event_type") == "last_trade_price" and asset_id in watched_assets:
+                                    active_assets.add(asset_id)
+                                    market_activity.set()
+                    finally:
+                        changed.cancel()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"Error in monitoring loop: {e}")
-                # Sleep for a bit before retrying
-                time.sleep(30)
+                logger.warning("Market stream error, relying on polling: %s", e)
+                await asyncio.sleep(30)
+    
+    async def _delayed_copy(self, trade_analyses: List[CopyDecision], copy_slots: asyncio.Semaphore) -> None:
+        """
+        Wait a random delay, then execute a batch of copy trades.
+        
+        Args:
+            trade_analyses: Copy decisions for the trades
+            copy_slots: Semaphore bounding how many batches are placed at once
+        """
+        # Add random delay before copying
+        delay = random.uniform(self._min_delay, self._max_delay)
+        logger.info("Waiting %.2f seconds before executing %d copies...", delay, len(trade_analyses))
+        await asyncio.sleep(delay)
+        
+        # Execute the copy trades
+        async with copy_slots:
+            trade_ids = await asyncio.to_thread(self.execute_copy_trades, trade_analyses)
+        
+        for trade_id in trade_ids:
+            if trade_id:
+                logger.info("Successfully copied trade as %s", trade_id)
+            else:
+                logger.warning("Failed to copy trade.")
     
     def show_statistics(self) -> Dict[str, Any]:
         """
@@ -481,42 +1194,35 @@ class PolymarketCopyTrader:
         Returns:
             Dict with statistics
         """
-        # Count total trades
-        total_trades = sum(len(trades) for trades in self.trade_history.values())
-        
-        # Calculate total amount traded
-        total_amount = sum(
-            trade["copy_amount"] 
-            for market_trades in self.trade_history.values() 
-            for trade in market_trades
-        )
-        
-        # Count markets
-        markets_count = len(self.trade_history)
-        
-        # Get most recent trade
+        # Count trades, total amount traded and the most recent trade in one pass.
+        # Timestamps are ISO 8601 strings, which sort the same as the times they hold
+        total_trades = 0
+        total_amount = 0
         most_recent = None
-        most_recent_time = None
+        most_recent_time = ""
         for market_trades in self.trade_history.values():
+            total_trades += len(market_trades)
             for trade in market_trades:
-                trade_time = datetime.datetime.fromisoformat(trade["timestamp"])
-                if most_recent_time is None or trade_time > most_recent_time:
+                total_amount += trade["copy_amount"]
+                if trade["timestamp"] > most_recent_time:
                     most_recent = trade
-                    most_recent_time = trade_time
+                    most_recent_time = trade["timestamp"]
+        
+        # Count markets
+        markets_count = len(self.trade_history)
         
         # Get trader analytics if available
         trader_stats = {}
-        for trader in self.watched_traders:
-            try:
-                info = self.analytics.analyze_trader_performance(trader)
-                if info:
-                    trader_stats[trader] = {
-                        "pnl": info.pnl,
-                        "win_rate": info.win_rate,
-                        "positions": info.total_positions
-                    }
-            except Exception as e:
-                print(f"Error getting analytics for {trader}: {e}")
+        try:
+            infos = self.analytics.analyze_traders_performance(self.watched_traders)
+            for trader, info in infos.items():
+                trader_stats[trader] = {
+                    "pnl": info.pnl,
+                    "win_rate": info.win_rate,
+                    "positions": info.total_positions
+                }
+        except Exception as e:
+            logger.error("Error getting analytics for watched traders: %s", e)
         
         return {
             "total_trades": total_trades,
@@ -528,8 +1234,9 @@ class PolymarketCopyTrader:
         }
 
 
-def main():
+def main() -> None:
     """Main entry point to run the copy trader"""
+    log_listener = setup_logging()
     copy_trader = PolymarketCopyTrader()
     
     # Example: Add some watched traders manually
@@ -556,6 +1263,8 @@ def main():
             print("\nWatched Trader Performance:")
             for addr, info in stats["trader_stats"].items():
                 print(f"  {addr} - PnL: ${info['pnl']:.2f}, Win Rate: {info['win_rate']:.2%}")
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
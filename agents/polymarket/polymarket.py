@@ -3,6 +3,7 @@
 
 import os
 import pdb
+import asyncio
 import time
 import ast
 import requests
@@ -32,6 +33,15 @@ from agents.utils.objects import SimpleMarket, SimpleEvent
 
 load_dotenv()
 
+# Gamma allows roughly 30 requests/s; paged fetches keep at most
+# GAMMA_PAGE_CONCURRENCY requests in flight and start no more than
+# GAMMA_REQUESTS_PER_SECOND of them each second
+GAMMA_PAGE_CONCURRENCY = 15
+GAMMA_REQUESTS_PER_SECOND = 25
+
+# Attempts per page for rate-limited, server-error or timed-out responses
+GAMMA_PAGE_ATTEMPTS = 4
+
 
 class Polymarket:
     def __init__(self) -> None:
@@ -39,6 +49,14 @@ class Polymarket:
         self.gamma_markets_endpoint = self.gamma_url + "/markets"
         self.gamma_events_endpoint = self.gamma_url + "/events"
 
+        # One pooled client for every Gamma request so repeat calls reuse
+        # the open connection instead of paying a fresh TCP/TLS handshake.
+        self._http = httpx.Client(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=15, keepalive_expiry=30),
+        )
+
         self.clob_url = "https://clob.polymarket.com"
         self.clob_auth_endpoint = self.clob_url + "/auth/api-key"
 
@@ -69,6 +87,21 @@ class Polymarket:
         self._init_api_keys()
         self._init_approvals(False)
 
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        self._http.close()
+
+    def __enter__(self) -> "Polymarket":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        http = getattr(self, "_http", None)
+        if http is not None:
+            http.close()
+
     def _init_api_keys(self) -> None:
         self.client = ClobClient(
             self.clob_url, key=self.private_key, chain_id=self.chain_id
@@ -186,17 +219,139 @@ class Polymarket:
         )
         print(ctf_approval_tx_receipt)
 
-    def get_all_markets(self) -> "list[SimpleMarket]":
+    def _gamma_params(
+        self,
+        limit: "int | None" = None,
+        offset: int = 0,
+        order: "str | None" = None,
+        ascending: bool = False,
+        **filters,
+    ) -> dict:
+        # Let Gamma do the paging, sorting and filtering so only the rows we
+        # need are sent back; filters left as None are not sent
+        params = {key: value for key, value in filters.items() if value is not None}
+        if limit is not None:
+            params["limit"] = limit
+        if offset:
+            params["offset"] = offset
+        if order:
+            params["order"] = order
+            params["ascending"] = ascending
+        return params
+
+    def get_all_markets(
+        self,
+        limit: "int | None" = None,
+        offset: int = 0,
+        order: "str | None" = None,
+        ascending: bool = False,
+        active: "bool | None" = None,
+        closed: "bool | None" = None,
+    ) -> "list[SimpleMarket]":
         markets = []
-        res = httpx.get(self.gamma_markets_endpoint)
+        params = self._gamma_params(
+            limit, offset, order, ascending, active=active, closed=closed
+        )
+        res = self._http.get(self.gamma_markets_endpoint, params=params)
         if res.status_code == 200:
-            for market in res.json():
+            markets = self._to_simple_markets(res.json())
+        return markets
+
+    async def get_all_markets_async(
+        self,
+        page_size: int = 100,
+        active: "bool | None" = None,
+        closed: "bool | None" = None,
+    ) -> "list[SimpleMarket]":
+        params = self._gamma_params(active=active, closed=closed)
+        rows = await self._fetch_gamma_pages(
+            self.gamma_markets_endpoint, params, page_size
+        )
+        return self._to_simple_markets(rows)
+
+    async def _fetch_gamma_pages(
+        self, endpoint: str, params: dict, page_size: int
+    ) -> list:
+        # Request pages in batches of GAMMA_PAGE_CONCURRENCY offsets over one
+        # HTTP/2 connection until a short page marks the end of the listing.
+        # Transient failures are retried with backoff and anything else is
+        # raised, so an error page is never mistaken for the end of the data
+        rows = []
+        offset = 0
+        limits = httpx.Limits(
+            max_connections=GAMMA_PAGE_CONCURRENCY,
+            max_keepalive_connections=GAMMA_PAGE_CONCURRENCY,
+        )
+        in_flight = asyncio.Semaphore(GAMMA_PAGE_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        request_interval = 1 / GAMMA_REQUESTS_PER_SECOND
+        next_start = loop.time()
+
+        async def wait_for_slot() -> None:
+            # Space request starts evenly to stay inside the per-second budget
+            nonlocal next_start
+            start_at = max(next_start, loop.time())
+            next_start = start_at + request_interval
+            await asyncio.sleep(start_at - loop.time())
+
+        async with httpx.AsyncClient(http2=True, timeout=30, limits=limits) as client:
+
+            async def fetch_page(page_offset: int) -> list:
+                page_params = {**params, "limit": page_size, "offset": page_offset}
+                for attempt in range(GAMMA_PAGE_ATTEMPTS):
+                    backoff = 2**attempt
+                    async with in_flight:
+                        await wait_for_slot()
+                        try:
+                            res = await client.get(endpoint, params=page_params)
+                        except httpx.TransportError:
+                            if attempt == GAMMA_PAGE_ATTEMPTS - 1:
+                                raise
+                            res = None
+                    if res is not None:
+                        if res.status_code == 200:
+                            return res.json()
+                        # Only a 200 carries a page; other 2xx/3xx replies
+                        # don't make raise_for_status() raise, so fail here
+                        retryable = res.status_code == 429 or res.status_code >= 500
+                        if not retryable or attempt == GAMMA_PAGE_ATTEMPTS - 1:
+                            raise httpx.HTTPStatusError(
+                                f"Unexpected status {res.status_code} from {res.url}",
+                                request=res.request,
+                                response=res,
+                            )
+                        retry_after = res.headers.get("Retry-After", "")
+                        if retry_after.isdigit():
+                            backoff = max(backoff, int(retry_after))
+                    await asyncio.sleep(backoff)
+
+            while True:
+                tasks = [
+                    asyncio.ensure_future(fetch_page(offset + i * page_size))
+                    for i in range(GAMMA_PAGE_CONCURRENCY)
+                ]
                 try:
-                    market_data = self.map_api_to_market(market)
-                    markets.append(SimpleMarket(**market_data))
-                except Exception as e:
-                    print(e)
-                    pass
+                    pages = await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+                for page in pages:
+                    rows.extend(page)
+                    if len(page) < page_size:
+                        return rows
+                offset += GAMMA_PAGE_CONCURRENCY * page_size
+
+    def _to_simple_markets(self, rows: list) -> "list[SimpleMarket]":
+        markets = []
+        for market in rows:
+            try:
+                market_data = self.map_api_to_market(market)
+                markets.append(SimpleMarket(**market_data))
+            except Exception as e:
+                print(e)
+                pass
         return markets
 
     def filter_markets_for_trading(self, markets: "list[SimpleMarket]"):
@@ -208,7 +363,7 @@ class Polymarket:
 
     def get_market(self, token_id: str) -> SimpleMarket:
         params = {"clob_token_ids": token_id}
-        res = httpx.get(self.gamma_markets_endpoint, params=params)
+        res = self._http.get(self.gamma_markets_endpoint, params=params)
         if res.status_code == 200:
             data = res.json()
             market = data[0]
@@ -235,19 +390,54 @@ class Polymarket:
             market["clob_token_ids"] = token_id
         return market
 
-    def get_all_events(self) -> "list[SimpleEvent]":
+    def get_all_events(
+        self,
+        limit: "int | None" = None,
+        offset: int = 0,
+        order: "str | None" = None,
+        ascending: bool = False,
+        active: "bool | None" = None,
+        closed: "bool | None" = None,
+        archived: "bool | None" = None,
+    ) -> "list[SimpleEvent]":
         events = []
-        res = httpx.get(self.gamma_events_endpoint)
+        params = self._gamma_params(
+            limit,
+            offset,
+            order,
+            ascending,
+            active=active,
+            closed=closed,
+            archived=archived,
+        )
+        res = self._http.get(self.gamma_events_endpoint, params=params)
         if res.status_code == 200:
             print(len(res.json()))
-            for event in res.json():
-                try:
-                    print(1)
-                    event_data = self.map_api_to_event(event)
-                    events.append(SimpleEvent(**event_data))
-                except Exception as e:
-                    print(e)
-                    pass
+            events = self._to_simple_events(res.json())
+        return events
+
+    async def get_all_events_async(
+        self,
+        page_size: int = 100,
+        active: "bool | None" = None,
+        closed: "bool | None" = None,
+        archived: "bool | None" = None,
+    ) -> "list[SimpleEvent]":
+        params = self._gamma_params(active=active, closed=closed, archived=archived)
+        rows = await self._fetch_gamma_pages(
+            self.gamma_events_endpoint, params, page_size
+        )
+        return self._to_simple_events(rows)
+
+    def _to_simple_events(self, rows: list) -> "list[SimpleEvent]":
+        events = []
+        for event in rows:
+            try:
+                event_data = self.map_api_to_event(event)
+                events.append(SimpleEvent(**event_data))
+            except Exception as e:
+                print(e)
+                pass
         return events
 
     def map_api_to_event(self, event) -> SimpleEvent:
@@ -0,0 +1,40 @@
+"""
+Compact binary keys for Ethereum addresses.
+"""
+
+from typing import Optional
+
+
+def address_key(address: Optional[str]) -> bytes:
+    """
+    Build a compact key for an address, for use in sets and dicts.
+
+    Args:
+        address: Address, usually a 0x-prefixed hex string
+
+    Returns:
+        The 20 raw address bytes, or the encoded string if it isn't a hex address
+    """
+    if address and len(address) == 42 and address.startswith("0x"):
+        try:
+            return bytes.fromhex(address[2:])
+        except ValueError:
+            pass
+    return (address or "").encode()
+
+
+def address_from_key(key: bytes) -> str:
+    """
+    Turn a key built by address_key back into an address string.
+
+    Hex addresses come back lowercased.
+
+    Args:
+        key: Key built by address_key
+
+    Returns:
+        The address as a string
+    """
+    if len(key) == 20:
+        return "0x" + key.hex()
+    return key.decode()
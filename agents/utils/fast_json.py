@@ -0,0 +1,50 @@
+"""
+JSON encoding helpers backed by orjson, falling back to the stdlib json
+module when orjson isn't installed.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Raw JSON as bytes, bytearray or str
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Values JSON has no type for, such as datetimes under the stdlib encoder,
+    are written as their str() representation.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with a two space indent
+
+    Returns:
+        The encoded JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 if indent else None
+        )
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
@@ -0,0 +1,34 @@
+"""
+Crash-safe file writes.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Replace a file's contents so that a crash leaves either the old or the new
+    version on disk, never a partial one.
+
+    The data goes to a temporary file next to the target, named per process
+    and thread so concurrent writers don't share it, and is flushed to disk
+    before being swapped in.
+
+    Args:
+        path: File to write
+        data: New contents
+    """
+    path = Path(path)
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
@@ -1,18 +1,36 @@
-import typer
-from devtools import pprint
+import asyncio
+import functools
+import heapq
+import sys
+from operator import attrgetter
 
-from agents.polymarket.polymarket import Polymarket
-from agents.connectors.chroma import PolymarketRAG
-from agents.connectors.news import News
-from agents.application.trade import Trader
-from agents.application.executor import Executor
-from agents.application.creator import Creator
-from agents.polymarket.copy_trader import PolymarketCopyTrader
+import typer
 
 app = typer.Typer()
-polymarket = Polymarket()
-newsapi_client = News()
-polymarket_rag = PolymarketRAG()
+
+
+# Heavy subsystems (web3, LangChain, chromadb) are imported on first use so
+# `--help` and the config commands don't pay for them; the factories keep a
+# single instance per process.
+@functools.lru_cache(maxsize=None)
+def _polymarket():
+    from agents.polymarket.polymarket import Polymarket
+
+    return Polymarket()
+
+
+@functools.lru_cache(maxsize=None)
+def _news():
+    from agents.connectors.news import News
+
+    return News()
+
+
+@functools.lru_cache(maxsize=None)
+def _rag():
+    from agents.connectors.chroma import PolymarketRAG
+
+    return PolymarketRAG()
 
 
 @app.command()
@@ -20,12 +38,22 @@ def get_all_markets(limit: int = 5, sort_by: str = "spread") -> None:
     """
     Query Polymarket's markets
     """
+    from devtools import pprint
+
     print(f"limit: int = {limit}, sort_by: str = {sort_by}")
-    markets = polymarket.get_all_markets()
+    polymarket = _polymarket()
+    # Only fetch the open markets we are going to show
+    markets = polymarket.get_all_markets(
+        limit=limit,
+        order="spread" if sort_by == "spread" else None,
+        active=True,
+        closed=False,
+    )
     markets = polymarket.filter_markets_for_trading(markets)
     if sort_by == "spread":
-        markets = sorted(markets, key=lambda x: x.spread, reverse=True)
-    markets = markets[:limit]
+        markets = heapq.nlargest(limit, markets, key=attrgetter("spread"))
+    else:
+        markets = markets[:limit]
     pprint(markets)
 
 
@@ -34,7 +62,9 @@ def get_relevant_news(keywords: str) -> None:
     """
     Use NewsAPI to query the internet
     """
-    articles = newsapi_client.get_articles_for_cli_keywords(keywords)
+    from devtools import pprint
+
+    articles = _news().get_articles_for_cli_keywords(keywords)
     pprint(articles)
 
 
@@ -43,12 +73,38 @@ def get_all_events(limit: int = 5, sort_by: str = "number_of_markets") -> None:
     """
     Query Polymarket's events
     """
+    from devtools import pprint
+
     print(f"limit: int = {limit}, sort_by: str = {sort_by}")
-    events = polymarket.get_all_events()
-    events = polymarket.filter_events_for_trading(events)
+    polymarket = _polymarket()
+    # Gamma can't sort by market count, so that ordering needs every tradeable
+    # event, fetched page by page concurrently; otherwise only the limit is fetched
     if sort_by == "number_of_markets":
-        events = sorted(events, key=lambda x: len(x.markets), reverse=True)
-    events = events[:limit]
+        import httpx
+
+        try:
+            events = asyncio.run(
+                polymarket.get_all_events_async(active=True, closed=False, archived=False)
+            )
+        except httpx.HTTPError as e:
+            print(f"Failed to fetch events from Gamma: {e!r}")
+            raise typer.Exit(code=1)
+        events = polymarket.filter_events_for_trading(events)
+        events = heapq.nlargest(limit, events, key=lambda x: len(x.markets))
+    else:
+        # Gamma can't filter out restricted events, so keep fetching pages
+        # until enough tradeable ones are left or the listing runs out
+        events = []
+        offset = 0
+        while len(events) < limit:
+            page = polymarket.get_all_events(
+                limit=limit, offset=offset, active=True, closed=False, archived=False
+            )
+            events.extend(polymarket.filter_events_for_trading(page))
+            if len(page) < limit:
+                break
+            offset += limit
+        events = events[:limit]
     pprint(events)
 
 
@@ -57,7 +113,7 @@ def create_local_markets_rag(local_directory: str) -> None:
     """
     Create a local markets database for RAG
     """
-    polymarket_rag.create_local_markets_rag(local_directory=local_directory)
+    _rag().create_local_markets_rag(local_directory=local_directory)
 
 
 @app.command()
@@ -65,7 +121,9 @@ def query_local_markets_rag(vector_db_directory: str, query: str) -> None:
     """
     RAG over a local database of Polymarket's events
     """
-    response = polymarket_rag.query_local_markets_rag(
+    from devtools import pprint
+
+    response = _rag().query_local_markets_rag(
         local_directory=vector_db_directory, query=query
     )
     pprint(response)
@@ -79,6 +137,8 @@ def ask_superforecaster(event_title: str, market_question: str, outcome: str) ->
     print(
         f"event: str = {event_title}, question: str = {market_question}, outcome (usually yes or no): str = {outcome}"
     )
+    from agents.application.executor import Executor
+
     executor = Executor()
     response = executor.get_superforecast(
         event_title=event_title, market_question=market_question, outcome=outcome
@@ -91,6 +151,8 @@ def create_market() -> None:
     """
     Format a request to create a market on Polymarket
     """
+    from agents.application.creator import Creator
+
     c = Creator()
     market_description = c.one_best_market()
     print(f"market_description: str = {market_description}")
@@ -101,6 +163,8 @@ def ask_llm(user_input: str) -> None:
     """
     Ask a question to the LLM and get a response.
     """
+    from agents.application.executor import Executor
+
     executor = Executor()
     response = executor.get_llm_response(user_input)
     print(f"LLM Response: {response}")
@@ -111,6 +175,8 @@ def ask_polymarket_llm(user_input: str) -> None:
     """
     What types of markets do you want trade?
     """
+    from agents.application.executor import Executor
+
     executor = Executor()
     response = executor.get_polymarket_llm(user_input=user_input)
     print(f"LLM + current markets&events response: {response}")
@@ -121,6 +187,8 @@ def run_autonomous_trader() -> None:
     """
     Let an autonomous system trade for you.
     """
+    from agents.application.trade import Trader
+
     trader = Trader()
     trader.one_best_trade()
 
@@ -147,35 +215,38 @@ def run_copy_trader(
         min_pnl: Minimum profit and loss for top traders (if finding top traders)
         activate_trading: Whether to activate actual trading (default: False - just simulate)
     """
+    from agents.polymarket.copy_trader import PolymarketCopyTrader, setup_logging
+
+    log_listener = setup_logging()
     copy_trader = PolymarketCopyTrader(config_path=config_path)
     
-    # If trading activation was requested
-    if activate_trading:
-        print("Activating trading functionality...")
-        copy_trader.config["trading_active"] = True
-        copy_trader._save_config()
-        print("Trading has been activated. The bot will execute real trades.")
+    try:
+        # If trading activation was requested
+        if activate_trading:
+            print("Activating trading functionality...")
+            copy_trader.config["trading_active"] = True
+            copy_trader._save_config()
+            print("Trading has been activated. The bot will execute real trades.")
     
-    # If finding top traders was requested
-    if find_top_traders:
-        print(f"Finding top traders (min win rate: {min_win_rate:.1%}, min PnL: ${min_pnl:.2f})...")
+        # If finding top traders was requested
+        if find_top_traders:
+            print(f"Finding top traders (min win rate: {min_win_rate:.1%}, min PnL: ${min_pnl:.2f})...")
         
-        # Update analytics config
-        copy_trader.config["analytics"]["enabled"] = True
-        copy_trader.config["analytics"]["min_win_rate"] = min_win_rate
-        copy_trader.config["analytics"]["min_pnl"] = min_pnl
-        copy_trader._save_config()
+            # Update analytics config
+            copy_trader.config["analytics"]["enabled"] = True
+            copy_trader.config["analytics"]["min_win_rate"] = min_win_rate
+            copy_trader.config["analytics"]["min_pnl"] = min_pnl
+            copy_trader._save_config()
         
-        # Run the trader update
-        copy_trader.update_traders_from_analytics()
+            # Run the trader update
+            copy_trader.update_traders_from_analytics()
     
-    # If an address was provided, add it to the watch list
-    if add_trader:
-        copy_trader.add_watched_trader(add_trader)
-        print(f"Added trader {add_trader} to watch list")
+        # If an address was provided, add it to the watch list
+        if add_trader:
+            copy_trader.add_watched_trader(add_trader)
+            print(f"Added trader {add_trader} to watch list")
     
-    # Start monitoring
-    try:
+        # Start monitoring
         print("Starting copy trader. Press Ctrl+C to stop.")
         copy_trader.monitor_traders()
     except KeyboardInterrupt:
@@ -183,16 +254,23 @@ def run_copy_trader(
         
         # Show statistics on exit
         stats = copy_trader.show_statistics()
-        print("\nTrading Statistics:")
-        print(f"Total Trades: {stats['total_trades']}")
-        print(f"Total Amount Traded: ${stats['total_amount_traded']:.2f}")
-        print(f"Markets Traded: {stats['markets_count']}")
-        print(f"Traders Watched: {stats['traders_watched']}")
+        # Build the report up front and write it in one go
+        lines = [
+            "\nTrading Statistics:\n",
+            f"Total Trades: {stats['total_trades']}\n",
+            f"Total Amount Traded: ${stats['total_amount_traded']:.2f}\n",
+            f"Markets Traded: {stats['markets_count']}\n",
+            f"Traders Watched: {stats['traders_watched']}\n",
+        ]
         
         if stats.get("trader_stats"):
-            print("\nWatched Trader Performance:")
+            lines.append("\nWatched Trader Performance:\n")
             for addr, info in stats["trader_stats"].items():
-                print(f"  {addr} - PnL: ${info['pnl']:.2f}, Win Rate: {info['win_rate']:.2%}")
+                lines.append(f"  {addr} - PnL: ${info['pnl']:.2f}, Win Rate: {info['win_rate']:.2%}\n")
+        sys.stdout.write("".join(lines))
+    finally:
+        copy_trader.close()
+        log_listener.stop()
 
 
 @app.command()
@@ -207,26 +285,31 @@ def analyze_top_traders(count: int = 10, min_win_rate: float = 0.6, min_pnl: flo
     """
     from agents.polymarket.analytics import PolymarketAnalytics
     
-    analytics = PolymarketAnalytics()
-    
     print(f"Finding top traders (min win rate: {min_win_rate:.1%}, min PnL: ${min_pnl:.2f})...")
-    recommended = analytics.get_recommended_traders(min_win_rate=min_win_rate, min_pnl=min_pnl)
+    with PolymarketAnalytics() as analytics:
+        recommended = analytics.get_recommended_traders(min_win_rate=min_win_rate, min_pnl=min_pnl)
     
-    print(f"\nFound {len(recommended)} traders matching criteria.")
-    print(f"\nTop {min(count, len(recommended))} recommended traders:")
+    # Build the report up front and write it in one go
+    lines = [
+        f"\nFound {len(recommended)} traders matching criteria.\n",
+        f"\nTop {min(count, len(recommended))} recommended traders:\n",
+    ]
     
     for i, trader in enumerate(recommended[:count], 1):
-        print(f"\n{i}. Address: {trader.address}")
+        lines.append(f"\n{i}. Address: {trader.address}\n")
         if trader.username:
-            print(f"   Username: {trader.username}")
-        print(f"   PnL: ${trader.pnl:.2f}")
-        print(f"   Win Rate: {trader.win_rate:.2%}")
-        print(f"   Total Positions: {trader.total_positions}")
-        print(f"   Active Positions: {trader.active_positions}")
+            lines.append(f"   Username: {trader.username}\n")
+        lines.append(
+            f"   PnL: ${trader.pnl:.2f}\n"
+            f"   Win Rate: {trader.win_rate:.2%}\n"
+            f"   Total Positions: {trader.total_positions}\n"
+            f"   Active Positions: {trader.active_positions}\n"
+        )
         
-    print("\nTo add these traders to your copy trader, use:")
+    lines.append("\nTo add these traders to your copy trader, use:\n")
     for trader in recommended[:min(3, len(recommended))]:
-        print(f"  python scripts/python/cli.py run-copy-trader --add-trader \"{trader.address}\"")
+        lines.append(f"  python scripts/python/cli.py run-copy-trader --add-trader \"{trader.address}\"\n")
+    sys.stdout.write("".join(lines))
 
 
 @app.command()
@@ -254,47 +337,61 @@ def config_copy_trader(
     # Load the current configuration
     copy_trader = PolymarketCopyTrader(config_path=config_path)
     
-    # Apply changes if provided
-    if min_amount is not None:
-        copy_trader.config["min_amount_to_copy"] = min_amount
-        print(f"Minimum amount to copy set to ${min_amount}")
+    try:
+        # Apply changes if provided, noting whether anything needs saving
+        dirty = False
+        if min_amount is not None:
+            dirty = True
+            copy_trader.config["min_amount_to_copy"] = min_amount
+            print(f"Minimum amount to copy set to ${min_amount}")
         
-    if max_amount is not None:
-        copy_trader.config["max_amount_to_copy"] = max_amount
-        print(f"Maximum amount to copy set to ${max_amount}")
+        if max_amount is not None:
+            dirty = True
+            copy_trader.config["max_amount_to_copy"] = max_amount
+            print(f"Maximum amount to copy set to ${max_amount}")
         
-    if copy_percentage is not None:
-        copy_trader.config["copy_percentage"] = copy_percentage
-        print(f"Copy percentage set to {copy_percentage:.1%}")
+        if copy_percentage is not None:
+            dirty = True
+            copy_trader.config["copy_percentage"] = copy_percentage
+            print(f"Copy percentage set to {copy_percentage:.1%}")
         
-    if auto_update is not None:
-        copy_trader.config["analytics"]["auto_update_traders"] = auto_update
-        print(f"Auto-update traders set to {auto_update}")
+        if auto_update is not None:
+            dirty = True
+            copy_trader.config["analytics"]["auto_update_traders"] = auto_update
+            print(f"Auto-update traders set to {auto_update}")
         
-    if activate_trading is not None:
-        copy_trader.config["trading_active"] = activate_trading
-        if activate_trading:
-            print("Trading has been ACTIVATED. The bot will execute real trades.")
-        else:
-            print("Trading has been DEACTIVATED. The bot will only simulate trades.")
+        if activate_trading is not None:
+            dirty = True
+            copy_trader.config["trading_active"] = activate_trading
+            if activate_trading:
+                print("Trading has been ACTIVATED. The bot will execute real trades.")
+            else:
+                print("Trading has been DEACTIVATED. The bot will only simulate trades.")
     
-    # Save the configuration
-    copy_trader._save_config()
+        # Save the configuration
+        if dirty:
+            copy_trader._save_config()
     
-    # Show current configuration summary
-    print("\nCurrent configuration:")
-    print(f"Minimum amount to copy: ${copy_trader.config['min_amount_to_copy']}")
-    print(f"Maximum amount to copy: ${copy_trader.config['max_amount_to_copy']}")
-    print(f"Copy percentage: {copy_trader.config['copy_percentage']:.1%}")
-    print(f"Trading active: {copy_trader.config['trading_active']}")
-    print(f"Auto-update traders: {copy_trader.config['analytics']['auto_update_traders']}")
+        # Show current configuration summary
+        print("\nCurrent configuration:")
+        print(f"Minimum amount to copy: ${copy_trader.config['min_amount_to_copy']}")
+        print(f"Maximum amount to copy: ${copy_trader.config['max_amount_to_copy']}")
+        print(f"Copy percentage: {copy_trader.config['copy_percentage']:.1%}")
+        print(f"Trading active: {copy_trader.config['trading_active']}")
+        print(f"Auto-update traders: {copy_trader.config['analytics']['auto_update_traders']}")
     
-    if copy_trader.watched_traders:
-        print(f"\nCurrently watching {len(copy_trader.watched_traders)} traders")
-    else:
-        print("\nNo traders currently in watch list.")
-        print("Use 'analyze-top-traders' command to find traders to copy.")
+        if copy_trader.watched_traders:
+            print(f"\nCurrently watching {len(copy_trader.watched_traders)} traders")
+        else:
+            print("\nNo traders currently in watch list.")
+            print("Use 'analyze-top-traders' command to find traders to copy.")
+    finally:
+        copy_trader.close()
 
 
 if __name__ == "__main__":
-    app()
+    try:
+        app()
+    finally:
+        if _polymarket.cache_info().currsize:
+            _polymarket().close()
@@ -10,7 +10,6 @@ from pathlib import Path
 from dotenv import load_dotenv
 import json
 import webbrowser
-import time
 
 def main():
     print("=" * 80)
@@ -66,8 +65,7 @@ def main():
                 "update_interval_hours": 24
             }
         }
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        config_file.write_text(json.dumps(default_config, indent=4))
         print(f"Created default configuration in {config_file}")
     
     # Guide for API keys
@@ -90,7 +88,6 @@ def main():
     if open_site.lower() in ('y', 'yes'):
         print("   Opening Polymarket API documentation...")
         webbrowser.open("https://docs.polymarket.com/")
-        time.sleep(1)
     
     print("\n3. ANALYTICS API KEYS")
     print("   The copy trader can use third-party analytics services to find top traders.")
@@ -102,13 +99,11 @@ def main():
     if open_analytics.lower() in ('y', 'yes'):
         print("   Opening PolymarketAnalytics.com...")
         webbrowser.open("https://polymarketanalytics.com/")
-        time.sleep(1)
     
     open_whales = input("\n   Open PolymarketWhales.info now? (y/n): ")
     if open_whales.lower() in ('y', 'yes'):
         print("   Opening PolymarketWhales.info...")
         webbrowser.open("https://polymarketwhales.info/")
-        time.sleep(1)
     
     print("\n" + "=" * 80)
     print("NEXT STEPS")
@@ -0,0 +1,84 @@
+"""
+% python -m unittest tests.test_analytics
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from agents.polymarket.analytics import PolymarketAnalytics, TraderInfo
+
+
+class TestPolymarketAnalytics(unittest.TestCase):
+    def setUp(self):
+        # The analytics client caches under the working directory
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
+        self.analytics = PolymarketAnalytics()
+        self.addCleanup(self.analytics.close)
+
+        # Stand in for the polymarketanalytics.com API
+        self.fetches = 0
+        self.traders = [TraderInfo(address="0x1", pnl=100.0, win_rate=0.8)]
+
+        async def fetch(client, count):
+            self.fetches += 1
+            await asyncio.sleep(0.05)
+            return list(self.traders)
+
+        self.analytics._afetch_from_polymarketanalytics = fetch
+
+    def test_concurrent_fetches_share_one_request(self):
+        async def fetch_twice():
+            return await asyncio.gather(
+                self.analytics.aget_top_traders("polymarketanalytics", 5, client=object()),
+                self.analytics.aget_top_traders("polymarketanalytics", 5, client=object()),
+            )
+
+        first, second = asyncio.run(fetch_twice())
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(first, self.traders)
+        self.assertEqual(second, self.traders)
+
+    def test_expired_cache_is_served_while_refreshing(self):
+        stale = [TraderInfo(address="0x2", pnl=50.0, win_rate=0.9)]
+        self.analytics._save_cached_traders("polymarketanalytics", stale)
+        self.analytics.cache_expiry = 0
+
+        # The expired data comes back at once, without waiting for the fetch
+        self.assertEqual(self.analytics.get_top_traders("polymarketanalytics", 5), stale)
+
+        for thread in threading.enumerate():
+            if thread.name == "refresh-polymarketanalytics":
+                thread.join()
+        self.assertEqual(self.fetches, 1)
+
+        self.analytics.cache_expiry = 60
+        self.assertEqual(self.analytics.get_top_traders("polymarketanalytics", 5), self.traders)
+        self.assertEqual(self.fetches, 1)
+
+    def test_failed_fetch_is_not_retried_until_the_error_expires(self):
+        self.traders = []
+
+        with self.assertLogs("agents.polymarket.analytics", "WARNING"):
+            first = self.analytics.get_top_traders("polymarketanalytics", 5)
+            second = self.analytics.get_top_traders("polymarketanalytics", 5)
+
+        # Both calls fall back to placeholders, but only the first one fetches
+        self.assertEqual(first, second)
+        self.assertEqual(self.fetches, 1)
+
+        self.analytics.error_cache_expiry = 0
+        self.traders = [TraderInfo(address="0x3", pnl=10.0, win_rate=0.7)]
+        self.assertEqual(self.analytics.get_top_traders("polymarketanalytics", 5), self.traders)
+        self.assertEqual(self.fetches, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
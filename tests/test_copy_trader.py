@@ -0,0 +1,234 @@
+"""
+% python -m unittest tests.test_copy_trader
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from agents.polymarket import copy_trader as copy_trader_module
+from agents.polymarket.copy_trader import CopyDecision, PolymarketCopyTrader
+from agents.utils.addresses import address_key
+
+TRADER_A = "0x" + "aa" * 20
+TRADER_B = "0x" + "bb" * 20
+TRADER_C = "0x" + "cc" * 20
+
+
+def make_record(trade_id, market_id="m1"):
+    return {
+        "timestamp": "2024-01-01T00:00:00",
+        "original_trade": {"id": trade_id},
+        "copied_trade_id": "copy-" + trade_id,
+        "copy_amount": 10.0,
+        "market_id": market_id,
+        "asset_id": "a1",
+        "side": "BUY",
+        "price": 0.5,
+    }
+
+
+class TestPolymarketCopyTrader(unittest.TestCase):
+    def setUp(self):
+        # The copy trader keeps its state under the working directory
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
+        # Creating a Polymarket client derives API keys over the network
+        patcher = mock.patch("agents.polymarket.copy_trader.Polymarket")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.data_dir = Path("data/copy_trader")
+        self.data_dir.mkdir(parents=True)
+        self.history_file = self.data_dir / "trade_history.jsonl"
+
+    def make_copy_trader(self):
+        copy_trader = PolymarketCopyTrader(config_path="config/copy_trader_config.json")
+        self.addCleanup(copy_trader.close)
+        return copy_trader
+
+    def read_history_lines(self):
+        return [json.loads(line) for line in self.history_file.read_text().splitlines()]
+
+    def test_config_keeps_its_four_space_layout(self):
+        copy_trader = self.make_copy_trader()
+        config_file = Path(copy_trader.config_path)
+        self.assertEqual(config_file.read_text(), json.dumps(copy_trader.config, indent=4))
+
+        copy_trader.add_watched_trader(TRADER_A)
+        self.assertEqual(config_file.read_text(), json.dumps(copy_trader.config, indent=4))
+
+    def test_migrates_legacy_history(self):
+        legacy = {"m1": [make_record("t1")], "m2": [make_record("t2", "m2")]}
+        (self.data_dir / "trade_history.json").write_text(json.dumps(legacy))
+
+        copy_trader = self.make_copy_trader()
+
+        self.assertEqual(copy_trader.trade_history, legacy)
+        self.assertEqual(
+            self.read_history_lines(), [make_record("t1"), make_record("t2", "m2")]
+        )
+
+    def test_skips_truncated_last_line(self):
+        self.history_file.write_text(
+            json.dumps(make_record("t1")) + "\n" + '{"timestamp": "2024-01-01T00:0'
+        )
+
+        copy_trader = self.make_copy_trader()
+        self.assertEqual(copy_trader.trade_history, {"m1": [make_record("t1")]})
+
+        # The cut-off record is compacted away, so new records append cleanly
+        copy_trader._append_trade_history(make_record("t2"))
+        self.assertEqual(
+            self.read_history_lines(), [make_record("t1"), make_record("t2")]
+        )
+
+    def test_copy_traders_do_not_share_history_records(self):
+        self.history_file.write_text(json.dumps(make_record("t1")) + "\n")
+
+        first = self.make_copy_trader()
+        first.trade_history["m1"][0]["copy_amount"] = 99.0
+        second = self.make_copy_trader()
+
+        self.assertEqual(second.trade_history, {"m1": [make_record("t1")]})
+
+    def test_seeds_seen_trade_ids_from_history(self):
+        self.history_file.write_text(json.dumps(make_record("t1")) + "\n")
+
+        copy_trader = self.make_copy_trader()
+
+        self.assertFalse(copy_trader._mark_seen("t1"))
+        self.assertTrue(copy_trader._mark_seen("t2"))
+        self.assertFalse(copy_trader._mark_seen("t2"))
+
+    def test_seen_trade_ids_evict_least_recently_seen(self):
+        copy_trader = self.make_copy_trader()
+
+        with mock.patch.object(copy_trader_module, "MAX_SEEN_TRADE_IDS", 2):
+            for trade_id in ("t1", "t2", "t1", "t3"):
+                copy_trader._mark_seen(trade_id)
+
+            self.assertFalse(copy_trader._mark_seen("t1"))
+            self.assertTrue(copy_trader._mark_seen("t2"))
+
+    def test_check_queue_skips_removed_traders(self):
+        copy_trader = self.make_copy_trader()
+        for trader in (TRADER_A, TRADER_B, TRADER_C):
+            copy_trader.add_watched_trader(trader)
+
+        now = time.time()
+        for trader, checked_at in ((TRADER_A, now - 100), (TRADER_B, now - 300), (TRADER_C, now - 200)):
+            copy_trader.last_check_time[address_key(trader)] = checked_at
+        copy_trader._requeue_traders([TRADER_A, TRADER_B, TRADER_C])
+        copy_trader.remove_watched_trader(TRADER_C)
+
+        # Only traders checked long enough ago are due
+        self.assertEqual(copy_trader._traders_by_last_check(now - 250), [TRADER_B])
+        self.assertEqual(copy_trader._traders_by_last_check(), [TRADER_A])
+
+        # Checked traders go back on the queue behind the ones still waiting
+        copy_trader.last_check_time[address_key(TRADER_B)] = now
+        copy_trader._requeue_traders([TRADER_A, TRADER_B, TRADER_C])
+        self.assertEqual(copy_trader._traders_by_last_check(), [TRADER_A, TRADER_B])
+        self.assertEqual(copy_trader._traders_by_last_check(), [])
+
+    def monitor_one_copy(self, copy_delay):
+        copy_trader = self.make_copy_trader()
+        copy_trader.add_watched_trader(TRADER_A)
+        checked_before = copy_trader.last_check_time[address_key(TRADER_A)]
+
+        # TRADER_A made one trade, which qualifies for copying
+        copy_trader.polymarket.client.get_trades.side_effect = [[{"id": "t1", "asset_id": "a1"}], []]
+        decision = CopyDecision(True, 10.0, "m1", "a1", "BUY", 0.5, {"id": "t1"})
+        copy_trader._min_delay = copy_trader._max_delay = copy_delay
+
+        async def monitor_briefly():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(copy_trader.amonitor_traders(), timeout=0.3)
+
+        with mock.patch.object(PolymarketCopyTrader, "should_update_traders", return_value=False), \
+                mock.patch.object(PolymarketCopyTrader, "analyze_trade", return_value=decision), \
+                mock.patch.object(PolymarketCopyTrader, "execute_copy_trades", return_value=["c1"]) as execute, \
+                mock.patch.object(copy_trader_module.websockets, "connect", side_effect=OSError("offline")):
+            with self.assertLogs("agents.polymarket.copy_trader", "WARNING"):
+                asyncio.run(monitor_briefly())
+
+        saved = copy_trader._load_last_check_times()[address_key(TRADER_A)]
+        return copy_trader, checked_before, saved, execute
+
+    def test_pending_copy_holds_back_saved_check_time(self):
+        copy_trader, checked_before, saved, execute = self.monitor_one_copy(copy_delay=60)
+
+        # The copy never ran, so a restart must fetch its trade again
+        execute.assert_not_called()
+        self.assertGreater(copy_trader.last_check_time[address_key(TRADER_A)], checked_before)
+        self.assertEqual(saved, checked_before)
+
+    def test_placed_copy_releases_saved_check_time(self):
+        copy_trader, checked_before, saved, execute = self.monitor_one_copy(copy_delay=0)
+
+        execute.assert_called_once()
+        self.assertEqual(copy_trader._copy_holds, {})
+        self.assertEqual(saved, copy_trader.last_check_time[address_key(TRADER_A)])
+        self.assertGreater(saved, checked_before)
+
+    def test_failing_traders_do_not_spin_the_monitor_loop(self):
+        copy_trader = self.make_copy_trader()
+        copy_trader.config["polling_interval"] = 1
+        copy_trader.add_watched_trader(TRADER_A)
+        copy_trader.add_watched_trader(TRADER_B)
+        copy_trader.polymarket.client.get_trades.side_effect = RuntimeError("unavailable")
+
+        # Every monitor cycle asks whether the watch list is due an update
+        cycles = 0
+
+        def should_update_traders(self):
+            nonlocal cycles
+            cycles += 1
+            return False
+
+        patcher = mock.patch.object(PolymarketCopyTrader, "should_update_traders", should_update_traders)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        async def monitor_briefly():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(copy_trader.amonitor_traders(), timeout=1.2)
+
+        with mock.patch.object(copy_trader_module, "MIN_POLL_INTERVAL_SECONDS", 0):
+            with self.assertLogs("agents.polymarket.copy_trader", "ERROR"):
+                asyncio.run(monitor_briefly())
+
+        # Failed traders stay overdue, so the loop waits on the poll budget:
+        # two traders a second after the first poll of both
+        self.assertLess(cycles, 10)
+        self.assertLessEqual(copy_trader.polymarket.client.get_trades.call_count, 2 * (2 + 3))
+
+    def test_market_stream_waits_while_no_assets_are_watched(self):
+        copy_trader = self.make_copy_trader()
+
+        async def watch_after_pruning():
+            # Pruning the last asset still flags a change to the stream
+            assets_changed = asyncio.Event()
+            assets_changed.set()
+            await asyncio.wait_for(
+                copy_trader._watch_market_activity({}, assets_changed, asyncio.Event(), set()),
+                timeout=0.1
+            )
+
+        with mock.patch.object(copy_trader_module.websockets, "connect") as connect:
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(watch_after_pruning())
+        connect.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+% python -m unittest tests.test_llm_cache
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from agents.application.llm_cache import LLMCache, request_key
+
+
+class TestLLMCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "llm_cache.json")
+
+        # Drive the clock by hand so expiry doesn't depend on timing
+        self.now = 1000.0
+        patcher = mock.patch("agents.application.llm_cache.time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_request_key_depends_on_the_whole_request(self):
+        key = request_key("gpt-4", "hello", ["search"])
+
+        self.assertEqual(key, request_key("gpt-4", "hello", ["search"]))
+        self.assertNotEqual(key, request_key("gpt-4", "hello"))
+        self.assertNotEqual(key, request_key("gpt-3.5", "hello", ["search"]))
+        self.assertNotEqual(key, request_key("gpt-4", "goodbye", ["search"]))
+
+    def test_entries_expire_after_ttl(self):
+        cache = LLMCache(self.path, ttl=60)
+        cache.set("k1", "answer")
+
+        self.now += 59
+        self.assertEqual(cache.get("k1"), "answer")
+        self.now += 1
+        self.assertIsNone(cache.get("k1"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LLMCache(self.path, max_entries=2)
+        cache.set("k1", "one")
+        cache.set("k2", "two")
+
+        # Reading k1 makes k2 the least recently used
+        cache.get("k1")
+        cache.set("k3", "three")
+
+        self.assertEqual(cache.get("k1"), "one")
+        self.assertIsNone(cache.get("k2"))
+        self.assertEqual(cache.get("k3"), "three")
+
+    def test_entries_persist_in_lru_order(self):
+        cache = LLMCache(self.path, max_entries=3)
+        cache.set("k1", "K1")
+        cache.set("k2", "K2")
+        cache.get("k1")
+        cache.set("k3", "K3")
+
+        # k2 is still the least recently used after a reload
+        reloaded = LLMCache(self.path, max_entries=3)
+        reloaded.set("k4", "K4")
+        self.assertIsNone(reloaded.get("k2"))
+        self.assertEqual([reloaded.get(key) for key in ("k1", "k3", "k4")], ["K1", "K3", "K4"])
+
+    def test_expired_entries_are_dropped_on_load(self):
+        cache = LLMCache(self.path, ttl=60)
+        cache.set("k1", "one")
+        self.now += 30
+        cache.set("k2", "two")
+
+        self.now += 40
+        reloaded = LLMCache(self.path, ttl=60)
+        self.assertIsNone(reloaded.get("k1"))
+        self.assertEqual(reloaded.get("k2"), "two")
+
+    def test_unreadable_file_starts_empty(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+
+        cache = LLMCache(self.path)
+        self.assertIsNone(cache.get("k1"))
+        cache.set("k1", "one")
+        self.assertEqual(LLMCache(self.path).get("k1"), "one")
+
+
+if __name__ == "__main__":
+    unittest.main()
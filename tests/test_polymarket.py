@@ -0,0 +1,102 @@
+"""
+% python -m unittest tests.test_polymarket
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from agents.polymarket import polymarket as polymarket_module
+from agents.polymarket.polymarket import Polymarket
+
+EVENTS_ENDPOINT = "https://gamma-api.polymarket.com/events"
+
+
+class TestGammaPaging(unittest.TestCase):
+    def setUp(self):
+        # The paging helper only needs the Gamma endpoints, not API keys
+        self.polymarket = Polymarket.__new__(Polymarket)
+
+        # Stand in for Gamma: 250 rows, with scripted failures per offset
+        self.rows = [{"id": str(i)} for i in range(250)]
+        self.failures = {}
+        self.requests = []
+
+        def handle(request):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            self.requests.append(offset)
+            failures = self.failures.get(offset)
+            if failures:
+                return failures.pop(0)
+            return httpx.Response(200, json=self.rows[offset : offset + limit])
+
+        real_client = httpx.AsyncClient
+
+        def client(**kwargs):
+            return real_client(transport=httpx.MockTransport(handle), **kwargs)
+
+        # Record backoff delays instead of waiting them out
+        self.sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def sleep(delay):
+            self.sleeps.append(delay)
+            await real_sleep(0)
+
+        for patcher in (
+            mock.patch.object(polymarket_module.httpx, "AsyncClient", client),
+            mock.patch.object(polymarket_module.asyncio, "sleep", sleep),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fetch(self):
+        return asyncio.run(
+            self.polymarket._fetch_gamma_pages(EVENTS_ENDPOINT, {"active": True}, 100)
+        )
+
+    def test_pages_until_a_short_page(self):
+        self.assertEqual(self.fetch(), self.rows)
+        # One batch of offsets covers the listing, and no later batch is sent
+        self.assertEqual(
+            sorted(self.requests),
+            [i * 100 for i in range(polymarket_module.GAMMA_PAGE_CONCURRENCY)],
+        )
+
+    def test_retries_rate_limits_and_server_errors(self):
+        self.failures[100] = [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(503),
+        ]
+
+        self.assertEqual(self.fetch(), self.rows)
+        self.assertEqual(self.requests.count(100), 3)
+        self.assertIn(7, self.sleeps)
+
+    def test_gives_up_after_the_last_attempt(self):
+        self.failures[100] = [
+            httpx.Response(503) for _ in range(polymarket_module.GAMMA_PAGE_ATTEMPTS)
+        ]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.fetch()
+        self.assertEqual(
+            self.requests.count(100), polymarket_module.GAMMA_PAGE_ATTEMPTS
+        )
+
+    def test_unexpected_status_is_raised_without_retrying(self):
+        for status in (204, 404):
+            with self.subTest(status=status):
+                self.requests.clear()
+                self.failures[0] = [httpx.Response(status)]
+
+                with self.assertRaises(httpx.HTTPStatusError):
+                    self.fetch()
+                self.assertEqual(self.requests.count(0), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()